@@ -307,6 +307,15 @@ class ExperimentJobProxy:
                 f"Job {self._job_id} {result.status.name.lower()}:\n{log}"
             )
 
+    def get_data(self, max_transfer_bytes: int = 50_000_000) -> dict[str, Any] | None:
+        """Experiment data of this job in columnar layout, decoded into NumPy arrays.
+
+        See [Client.get_experiment_data_columns][icon.client.client.Client.get_experiment_data_columns].
+        """
+        return self._client.get_experiment_data_columns(
+            self._job_id, max_transfer_bytes=max_transfer_bytes
+        )
+
     def cancel(self) -> None:
         """Cancel this job. No-op if already processed."""
         self._client.trigger_method(
@@ -9,6 +9,7 @@ from icon.client.api.experiments_controller import ExperimentsController
 from icon.client.api.parameters_controller import ParametersController
 from icon.serialization.deserializer import loads
 from icon.serialization.serializer import dump
+from icon.serialization.typed_array import decode_arrays
 
 if TYPE_CHECKING:
     from icon.serialization.types import SerializedIconObject
@@ -91,6 +92,26 @@ def get_value(
     return loads(serialized_object=result)
 
 
+def get_experiment_data_columns(
+    sio_client: socketio.AsyncClient,
+    loop: asyncio.AbstractEventLoop,
+    job_id: int,
+    max_transfer_bytes: int,
+) -> dict[str, Any] | None:
+    async def async_get_experiment_data_columns() -> Any:
+        return await sio_client.call(
+            "get_experiment_data_columns",
+            {"job_id": job_id, "max_transfer_bytes": max_transfer_bytes},
+        )
+
+    result = asyncio.run_coroutine_threadsafe(
+        async_get_experiment_data_columns(),
+        loop=loop,
+    ).result()
+
+    return decode_arrays(result)
+
+
 class Client(pydase.Client):
     def __init__(
         self,
@@ -98,9 +119,20 @@ class Client(pydase.Client):
         url: str,
         block_until_connected: bool = True,
         sio_client_kwargs: dict[str, Any] | None = None,
+        binary_experiment_data: bool = False,
     ):
+        """Connect to an ICON server.
+
+        Args:
+            url: URL of the ICON server.
+            block_until_connected: Wait for the connection before returning.
+            sio_client_kwargs: Additional arguments for the Socket.IO client.
+            binary_experiment_data: Receive `experiment_{job_id}` events with
+                shot and vector channels as binary array attachments.
+        """
         if sio_client_kwargs is None:
             sio_client_kwargs = {}
+        self._binary_experiment_data = binary_experiment_data
         super().__init__(
             url=url,
             block_until_connected=block_until_connected,
@@ -113,6 +145,8 @@ class Client(pydase.Client):
 
     async def _handle_connect(self) -> None:
         logger.debug("Connected to '%s' ...", self._url)
+        if self._binary_experiment_data:
+            await self._sio.emit("enable_binary_experiment_data")
 
     async def _handle_disconnect(self) -> None:
         logger.debug("Disconnected from '%s' ...", self._url)
@@ -150,3 +184,26 @@ class Client(pydase.Client):
             args=args or [],
             kwargs=kwargs or {},
         )
+
+    def get_experiment_data_columns(
+        self, job_id: int, max_transfer_bytes: int = 50_000_000
+    ) -> dict[str, Any] | None:
+        """Fetch the columnar experiment data of a job as NumPy arrays.
+
+        The arrays are transferred as binary Socket.IO attachments and decoded
+        without copying into NumPy arrays.
+
+        Args:
+            job_id: The unique identifier of the job.
+            max_transfer_bytes: Approximate cap on the payload size in bytes.
+
+        Returns:
+            Dict with the fields of `ColumnarExperimentData`, or None if the job has no
+            data file yet.
+        """
+        return get_experiment_data_columns(
+            sio_client=self._sio,
+            loop=self._loop,
+            job_id=job_id,
+            max_transfer_bytes=max_transfer_bytes,
+        )
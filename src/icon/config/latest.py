@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from confz import BaseConfig
 from pydantic import BaseModel
@@ -11,8 +11,35 @@ class HealthCheckConfig(BaseModel):
     interval_seconds: float = 10.0
 
 
+ShotChannelDtype = Literal["bool", "uint8", "uint16", "uint32", "float64"]
+
+
+class ShotStatisticsConfig(BaseModel):
+    histogram_bins: int = 32
+    thresholds: list[float] = [0.5]
+    channel_thresholds: dict[str, list[float]] = {}
+
+
+class ExperimentDataCacheConfig(BaseModel):
+    max_bytes: int = 500_000_000
+    max_jobs: int = 32
+
+
+class CompactionConfig(BaseModel):
+    enabled: bool = True
+    compression: Literal["gzip", "lzf"] | None = "gzip"
+    compression_opts: int | None = 4
+    io_bytes_per_second: int = 20_000_000
+    min_job_age_seconds: float = 300.0
+    poll_interval_seconds: float = 30.0
+
+
 class DataConfiguration(BaseModel):
     results_dir: str = str(Path.cwd() / "output")
+    shot_channel_dtypes: dict[str, ShotChannelDtype] = {}
+    shot_statistics: ShotStatisticsConfig = ShotStatisticsConfig()
+    experiment_data_cache: ExperimentDataCacheConfig = ExperimentDataCacheConfig()
+    compaction: CompactionConfig = CompactionConfig()
 
 
 class ExperimentLibraryConfig(BaseModel):
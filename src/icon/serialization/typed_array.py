@@ -0,0 +1,115 @@
+"""Encoding of NumPy arrays as typed buffers.
+
+Arrays are sent as a small JSON-compatible header (dtype and shape) plus their raw
+little-endian bytes. Compared to nested lists this avoids serialising every element
+individually and lets clients map the bytes directly onto typed arrays (e.g.
+`Float64Array` in the browser or `numpy.frombuffer` in Python).
+
+The bytes are either base64-encoded (for transports that only support JSON, such as
+RPC results serialised by the `IconSerializer`) or kept as `bytes`, which Socket.IO
+sends as binary attachments.
+"""
+
+from __future__ import annotations
+
+import base64
+from dataclasses import fields, is_dataclass
+from typing import Any, TypedDict
+
+import numpy as np
+import numpy.typing as npt
+
+
+class EncodedArray(TypedDict):
+    """JSON-compatible representation of a NumPy array."""
+
+    dtype: str
+    """Little-endian NumPy dtype string, e.g. `"<f8"`."""
+    shape: list[int]
+    """Shape of the array."""
+    data: str
+    """Base64-encoded C-contiguous array bytes."""
+
+
+class BinaryArray(TypedDict):
+    """Representation of a NumPy array for binary transports."""
+
+    dtype: str
+    """Little-endian NumPy dtype string, e.g. `"<f8"`."""
+    shape: list[int]
+    """Shape of the array."""
+    data: bytes
+    """C-contiguous array bytes."""
+
+
+def to_little_endian(array: npt.NDArray[Any]) -> npt.NDArray[Any]:
+    """Return a C-contiguous little-endian version of *array*."""
+    dtype = (
+        array.dtype.newbyteorder("<") if array.dtype.byteorder == ">" else array.dtype
+    )
+    return np.ascontiguousarray(array, dtype=dtype)
+
+
+def encode_array(array: npt.NDArray[Any]) -> EncodedArray:
+    """Encode a NumPy array as a typed buffer with base64 content."""
+    array = to_little_endian(array)
+    return {
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "data": base64.b64encode(array.tobytes()).decode("ascii"),
+    }
+
+
+def encode_binary_array(array: npt.NDArray[Any]) -> BinaryArray:
+    """Encode a NumPy array as a typed buffer with raw `bytes` content."""
+    array = to_little_endian(array)
+    return {
+        "dtype": array.dtype.str,
+        "shape": list(array.shape),
+        "data": array.tobytes(),
+    }
+
+
+def decode_array(encoded: EncodedArray | BinaryArray) -> npt.NDArray[Any]:
+    """Decode an [EncodedArray][..EncodedArray] or [BinaryArray][..BinaryArray]."""
+    data = encoded["data"]
+    buffer = base64.b64decode(data) if isinstance(data, str) else data
+    return np.frombuffer(buffer, dtype=np.dtype(encoded["dtype"])).reshape(
+        encoded["shape"]
+    )
+
+
+def is_encoded_array(obj: Any) -> bool:
+    """Return True if *obj* looks like an encoded or binary array."""
+    return isinstance(obj, dict) and obj.keys() == EncodedArray.__annotations__.keys()
+
+
+def encode_arrays(obj: Any, *, binary: bool = False) -> Any:
+    """Recursively replace NumPy arrays (also inside dataclasses) by typed buffers.
+
+    Args:
+        obj: Object to encode. Dataclasses are converted to dicts.
+        binary: If True, arrays are encoded as [BinaryArray][..BinaryArray],
+            otherwise as [EncodedArray][..EncodedArray].
+    """
+    if isinstance(obj, np.ndarray):
+        return encode_binary_array(obj) if binary else encode_array(obj)
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            field.name: encode_arrays(getattr(obj, field.name), binary=binary)
+            for field in fields(obj)
+        }
+    if isinstance(obj, dict):
+        return {key: encode_arrays(value, binary=binary) for key, value in obj.items()}
+    return obj
+
+
+def decode_arrays(obj: Any) -> Any:
+    """Recursively replace encoded arrays inside dicts and lists by NumPy arrays."""
+    if is_encoded_array(obj):
+        return decode_array(obj)
+    if isinstance(obj, dict):
+        return {key: decode_arrays(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [decode_arrays(value) for value in obj]
+    return obj
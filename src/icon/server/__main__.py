@@ -53,6 +53,7 @@ def start_server() -> None:
     from icon.server.hardware_processing.worker import (
         HardwareProcessingWorker,
     )
+    from icon.server.post_processing.compaction import CompactionWorker
     from icon.server.post_processing.worker import PostProcessingWorker
     from icon.server.pre_processing.worker import PreProcessingWorker
     from icon.server.scheduler.scheduler import Scheduler
@@ -101,6 +102,10 @@ def start_server() -> None:
     )
     post_processing_worker.start()
 
+    CompactionWorker(
+        hardware_processing_queue=SRM.hardware_processing_queue,
+    ).start()
+
     icon.server.web_server.icon_server.IconServer(
         APIService(
             experiment_library_client=exp_lib_client,
@@ -113,6 +118,18 @@ def start_server() -> None:
     ).run()
 
 
+def backfill_job_data_summary_and_exit() -> None:
+    from icon.server.data_access.db_context.sqlite.migrations import run_migrations
+    from icon.server.data_access.repositories.job_data_summary_repository import (
+        JobDataSummaryRepository,
+    )
+
+    run_migrations()
+    count = JobDataSummaryRepository.backfill()
+    click.echo(f"Backfilled job data summary of {count} jobs")
+    raise SystemExit(0)
+
+
 @click.command(context_settings={"help_option_names": ["-h", "--help"]})
 @click.option("-V", "--version", is_flag=True, help="Print version.")
 @click.option("-v", "--verbose", count=True, help="Increase verbosity (-v, -vv).")
@@ -125,7 +142,19 @@ def start_server() -> None:
     show_default=True,
     help="Path to the configuration file.",
 )
-def main(*, version: bool, verbose: int, quiet: int, config: pathlib.Path) -> None:
+@click.option(
+    "--backfill-job-data-summary",
+    is_flag=True,
+    help="Populate the job data summary from the results directory and exit.",
+)
+def main(
+    *,
+    version: bool,
+    verbose: int,
+    quiet: int,
+    config: pathlib.Path,
+    backfill_job_data_summary: bool,
+) -> None:
     """Start the ICON server."""
     if version:
         from importlib.metadata import distribution
@@ -138,6 +167,8 @@ def main(*, version: bool, verbose: int, quiet: int, config: pathlib.Path) -> No
     setup_logging(level)
 
     set_config_path(config or pathlib.Path.home() / ".config/icon/config.yaml")
+    if backfill_job_data_summary:
+        backfill_job_data_summary_and_exit()
     try:
         start_server()
     except KeyboardInterrupt:
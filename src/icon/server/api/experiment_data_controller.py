@@ -1,20 +1,37 @@
 import asyncio
+import functools
 from dataclasses import asdict
 from typing import Any
 
 import numpy as np
 import pydase
 
+from icon.serialization.typed_array import encode_arrays
+from icon.server.data_access.models.enums import JobStatus
+from icon.server.data_access.models.sqlite.job_data_summary import JobDataSummary
+from icon.server.data_access.repositories.experiment_data_cache import (
+    experiment_data_cache,
+)
 from icon.server.data_access.repositories.experiment_data_repository import (
     ExperimentDataRepository,
     delete_fit_result_by_job_id,
     write_fit_result_by_job_id,
 )
+from icon.server.data_access.repositories.job_data_summary_repository import (
+    JobDataSummaryRepository,
+)
+from icon.server.data_access.repositories.job_repository import JobRepository
 from icon.server.fitting import run_curve_fit
+from icon.server.utils.decimation import DecimationMethod
 from icon.server.web_server.socketio_emit_queue import emit_queue
 
 __all__ = ["ExperimentDataController"]
 
+_get_decimated_result_channel_of_finished_job = functools.lru_cache(maxsize=256)(
+    ExperimentDataRepository.get_decimated_result_channel
+)
+"""Cached decimation levels of finished jobs, whose data no longer changes."""
+
 
 class ExperimentDataController(pydase.DataService):
     """Controller for accessing stored experiment data.
@@ -38,15 +55,182 @@ class ExperimentDataController(pydase.DataService):
             The experiment data linked to the job as a dict resulting
             from serializing an
             [ExperimentData][icon.server.data_access.repositories.experiment_data_repository.ExperimentData]
-            instance.
+            instance. Served from the
+            [experiment data cache][icon.server.data_access.repositories.experiment_data_cache.ExperimentDataCache]
+            when possible.
         """
         result = await asyncio.to_thread(
-            ExperimentDataRepository.get_experiment_data_by_job_id,
+            experiment_data_cache.get_experiment_data_by_job_id,
             job_id=job_id,
             max_transfer_bytes=max_transfer_bytes,
         )
         return asdict(result)
 
+    async def get_experiment_data_columns_by_job_id(
+        self, job_id: int, max_transfer_bytes: int = 50_000_000
+    ) -> dict[str, Any] | None:
+        """Return experiment data for a given job in columnar layout.
+
+        Instead of `{index: value}` dicts, every channel is a flat array aligned with
+        the `index` array, shot channels are 2-D arrays (data points x shots) and
+        vector channels are given as `index`/`offsets`/`values` arrays. Each array is
+        sent as an [EncodedArray][icon.serialization.typed_array.EncodedArray]
+        (dtype, shape and base64-encoded little-endian bytes), which is much cheaper
+        to build, serialise and parse than per-index dicts for large jobs.
+
+        Args:
+            job_id: The unique identifier of the job.
+            max_transfer_bytes: Approximate cap on the payload size in bytes.
+                Defaults to 50 MB.
+
+        Returns:
+            The serialised
+            [ColumnarExperimentData][icon.server.data_access.repositories.experiment_data_repository.ColumnarExperimentData],
+            or None if the job has no data file yet.
+        """
+        result = await asyncio.to_thread(
+            ExperimentDataRepository.get_experiment_data_columns_by_job_id,
+            job_id=job_id,
+            max_transfer_bytes=max_transfer_bytes,
+        )
+        return encode_arrays(result)
+
+    async def get_experiment_data_since_index(
+        self, job_id: int, since_index: int, until_index: int | None = None
+    ) -> dict[str, Any]:
+        """Return only the experiment data added after a given data point.
+
+        Intended for clients that reconnect or poll: they pass the number of data
+        points they already hold and merge the returned data into their state.
+
+        Args:
+            job_id: The unique identifier of the job.
+            since_index: Index of the first data point to return.
+            until_index: Optional exclusive upper bound on the returned indices.
+
+        Returns:
+            The serialised
+            [ExperimentData][icon.server.data_access.repositories.experiment_data_repository.ExperimentData]
+            restricted to the requested range. `total_data_points` holds the
+            current number of data points of the job.
+        """
+        result = await asyncio.to_thread(
+            ExperimentDataRepository.get_experiment_data_since_index,
+            job_id=job_id,
+            since_index=since_index,
+            until_index=until_index,
+        )
+        return asdict(result)
+
+    async def get_decimated_result_channel(
+        self,
+        job_id: int,
+        result_channel: str,
+        target_points: int = 1000,
+        method: DecimationMethod = "lttb",
+        x_parameter: str | None = None,
+        x_range: list[float] | None = None,
+        start_index: int = 0,
+        stop_index: int | None = None,
+    ) -> dict[str, Any] | None:
+        """Return a downsampled view of a result channel for plotting.
+
+        Long jobs are reduced to about `target_points` points over the whole range
+        instead of dropping the early data points. Zoomed views are requested by
+        calling again with a narrower `x_range` or index range. Results for
+        finished jobs are cached.
+
+        Args:
+            job_id: The unique identifier of the job.
+            result_channel: Name of the result channel.
+            target_points: Maximum number of returned points.
+            method: "lttb" (Largest-Triangle-Three-Buckets) or "minmax" (min/max
+                envelope).
+            x_parameter: Scan parameter used as x axis. Defaults to the data point
+                index.
+            x_range: Optional [min, max] range of x values.
+            start_index: First data point index to consider.
+            stop_index: Optional exclusive upper bound on the data point indices.
+
+        Returns:
+            The serialised
+            [DecimatedResultChannel][icon.server.data_access.repositories.experiment_data_repository.DecimatedResultChannel]
+            with arrays encoded as
+            [EncodedArray][icon.serialization.typed_array.EncodedArray], or None if
+            the job has no data for this channel.
+        """
+        job = await asyncio.to_thread(JobRepository.get_job_by_id, job_id=job_id)
+        get_decimated_result_channel = (
+            _get_decimated_result_channel_of_finished_job
+            if job.status == JobStatus.PROCESSED
+            else ExperimentDataRepository.get_decimated_result_channel
+        )
+        result = await asyncio.to_thread(
+            get_decimated_result_channel,
+            job_id=job_id,
+            result_channel=result_channel,
+            target_points=target_points,
+            method=method,
+            x_parameter=x_parameter,
+            x_range=(x_range[0], x_range[1]) if x_range is not None else None,
+            start_index=start_index,
+            stop_index=stop_index,
+        )
+        return encode_arrays(result)
+
+    async def get_shot_statistics(
+        self, job_id: int, start_index: int = 0, stop_index: int | None = None
+    ) -> dict[str, Any] | None:
+        """Return per-data-point histograms and statistics of the shot channels.
+
+        Lets shot-channel plots avoid fetching the full (data points x shots)
+        matrices.
+
+        Args:
+            job_id: The unique identifier of the job.
+            start_index: First data point index to return.
+            stop_index: Optional exclusive upper bound on the data point indices.
+
+        Returns:
+            Mapping of shot channel name to the serialised
+            [ShotStatistics][icon.server.post_processing.shot_statistics.ShotStatistics]
+            with arrays encoded as
+            [EncodedArray][icon.serialization.typed_array.EncodedArray], or None if
+            the job has no data file yet.
+        """
+        result = await asyncio.to_thread(
+            ExperimentDataRepository.get_shot_statistics_by_job_id,
+            job_id=job_id,
+            start_index=start_index,
+            stop_index=stop_index,
+        )
+        return encode_arrays(result)
+
+    async def get_job_data_summaries(
+        self,
+        job_ids: list[int] | None = None,
+        experiment_source_id: int | None = None,
+    ) -> list[JobDataSummary]:
+        """Return per-job facts about the stored data without opening HDF5 files.
+
+        Each summary holds the number of data points, channel names, realtime flag,
+        last timestamp, fitted channels and file size of a job.
+
+        Args:
+            job_ids: Optional job identifiers to restrict to.
+            experiment_source_id: Optional experiment source filter.
+
+        Returns:
+            The matching summaries ordered by job ID.
+        """
+        return list(
+            await asyncio.to_thread(
+                JobDataSummaryRepository.get_summaries,
+                job_ids=job_ids,
+                experiment_source_id=experiment_source_id,
+            )
+        )
+
     async def run_fit(
         self,
         job_id: int,
@@ -68,7 +252,7 @@ class ExperimentDataController(pydase.DataService):
             Serialised FitResult dict.
         """
         data = await asyncio.to_thread(
-            ExperimentDataRepository.get_experiment_data_by_job_id,
+            experiment_data_cache.get_experiment_data_by_job_id,
             job_id=job_id,
         )
 
@@ -110,6 +294,12 @@ class ExperimentDataController(pydase.DataService):
                 job_id=job_id,
                 fit_result=fit_result,
             )
+            await asyncio.to_thread(
+                JobDataSummaryRepository.update_fitted_channel,
+                job_id=job_id,
+                result_channel=result_channel,
+                has_fit=True,
+            )
 
         result_dict = asdict(fit_result)
         emit_queue.put(
@@ -136,6 +326,12 @@ class ExperimentDataController(pydase.DataService):
             job_id=job_id,
             result_channel=result_channel,
         )
+        await asyncio.to_thread(
+            JobDataSummaryRepository.update_fitted_channel,
+            job_id=job_id,
+            result_channel=result_channel,
+            has_fit=False,
+        )
         emit_queue.put(
             {
                 "event": f"experiment_fit_{job_id}",
@@ -5,6 +5,10 @@ from pydase.task.decorator import task
 
 from icon.config.config import get_config
 from icon.server.data_access.db_context import influxdb_v1
+from icon.server.data_access.repositories.experiment_data_cache import (
+    ExperimentDataCacheStats,
+    experiment_data_cache,
+)
 from icon.server.hardware_processing.hardware_controller import HardwareController
 from icon.server.web_server.socketio_emit_queue import emit_queue
 
@@ -36,6 +40,14 @@ class StatusController(pydase.DataService):
             "hardware": self._hardware_available,
         }
 
+    def get_experiment_data_cache_stats(self) -> ExperimentDataCacheStats:
+        """Return memory usage, limits and hit ratio of the experiment data cache.
+
+        See
+        [ExperimentDataCacheStats][icon.server.data_access.repositories.experiment_data_cache.ExperimentDataCacheStats].
+        """
+        return experiment_data_cache.get_stats()
+
     def check_influxdb_status(self) -> None:
         """Check if InfluxDB is responsive and update status.
 
@@ -10,6 +10,7 @@ from icon.server.data_access.models.sqlite.base import Base
 from icon.server.data_access.models.sqlite.device import Device
 from icon.server.data_access.models.sqlite.experiment_source import ExperimentSource
 from icon.server.data_access.models.sqlite.job import Job
+from icon.server.data_access.models.sqlite.job_data_summary import JobDataSummary
 from icon.server.data_access.models.sqlite.job_run import JobRun
 from icon.server.data_access.models.sqlite.scan_parameter import ScanParameter
 
@@ -18,6 +19,7 @@ __all__ = [
     "Device",
     "ExperimentSource",
     "Job",
+    "JobDataSummary",
     "JobRun",
     "ScanParameter",
 ]
@@ -0,0 +1,98 @@
+import datetime
+
+import sqlalchemy
+import sqlalchemy.orm
+
+from icon.server.data_access.models.sqlite.base import Base
+from icon.server.data_access.models.sqlite.scan_parameter import JSONEncodedList
+
+
+class JobDataSummary(Base):
+    """SQLAlchemy model for per-job facts about the stored experiment data.
+
+    Mirrors information of a job's HDF5 file so that listings and lookups do not have
+    to open the file. Kept up to date by post-processing and fitting.
+
+    Constraints:
+        - One row per job.
+        - Indexed by `(experiment_source_id, has_fit, job_id)`.
+    """
+
+    __tablename__ = "job_data_summary"
+    __table_args__ = (
+        sqlalchemy.Index(
+            "by_experiment_source_and_fit",
+            "experiment_source_id",
+            "has_fit",
+            "job_id",
+        ),
+    )
+
+    job_id: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        sqlalchemy.ForeignKey("job_submissions.id"), primary_key=True
+    )
+    """Job the summary belongs to."""
+
+    experiment_source_id: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        sqlalchemy.ForeignKey("experiment_sources.id")
+    )
+    """Experiment source of the job."""
+
+    number_of_data_points: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        default=0
+    )
+    """Number of data points stored in the job's HDF5 file."""
+
+    result_channels: sqlalchemy.orm.Mapped[list[str]] = sqlalchemy.orm.mapped_column(
+        JSONEncodedList, default=list
+    )
+    """Names of the result channels."""
+
+    shot_channels: sqlalchemy.orm.Mapped[list[str]] = sqlalchemy.orm.mapped_column(
+        JSONEncodedList, default=list
+    )
+    """Names of the shot channels."""
+
+    vector_channels: sqlalchemy.orm.Mapped[list[str]] = sqlalchemy.orm.mapped_column(
+        JSONEncodedList, default=list
+    )
+    """Names of the vector channels."""
+
+    realtime_scan: sqlalchemy.orm.Mapped[bool] = sqlalchemy.orm.mapped_column(
+        default=False
+    )
+    """True if the job scans a realtime parameter."""
+
+    last_timestamp: sqlalchemy.orm.Mapped[str | None] = sqlalchemy.orm.mapped_column(
+        default=None
+    )
+    """Acquisition timestamp (ISO string) of the last data point."""
+
+    fitted_channels: sqlalchemy.orm.Mapped[list[str]] = sqlalchemy.orm.mapped_column(
+        JSONEncodedList, default=list
+    )
+    """Result channels with a stored fit."""
+
+    has_fit: sqlalchemy.orm.Mapped[bool] = sqlalchemy.orm.mapped_column(default=False)
+    """True if at least one fit is stored."""
+
+    file_size: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(default=0)
+    """Size of the HDF5 file in bytes."""
+
+    compacted: sqlalchemy.orm.Mapped[bool] = sqlalchemy.orm.mapped_column(
+        default=False, server_default=sqlalchemy.false()
+    )
+    """True once the HDF5 file was rewritten by the compaction worker."""
+
+    updated: sqlalchemy.orm.Mapped[datetime.datetime] = sqlalchemy.orm.mapped_column(
+        default=lambda: datetime.datetime.now(datetime.UTC),
+        onupdate=lambda: datetime.datetime.now(datetime.UTC),
+    )
+    """Time of the last update of this summary."""
+
+    def __repr__(self) -> str:
+        return (
+            f"<JobDataSummary job_id={self.job_id} "
+            f"number_of_data_points={self.number_of_data_points} "
+            f"has_fit={self.has_fit}>"
+        )
@@ -167,6 +167,7 @@ class PyCrystalClient(BlockingExperimentLibraryClient):
             "vector_channel_windows": [
                 plot_window_metadata(m) for m in readout.vector_channel_windows
             ],
+            "shot_channel_dtypes": getattr(readout, "shot_channel_dtypes", {}),
         }
 
     def get_setup_hardware_description(self) -> dict[str, dict[str, Any]]:
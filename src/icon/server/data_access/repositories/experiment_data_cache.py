@@ -0,0 +1,369 @@
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, TypedDict
+
+from icon.config.config import get_config
+from icon.server.data_access.repositories.experiment_data_repository import (
+    ExperimentData,
+    ExperimentDataRepository,
+    ParameterValue,
+)
+from icon.server.web_server.socketio_emit_queue import EmitEvent
+
+logger = logging.getLogger(__name__)
+
+_DATA_POINT_EVENT = re.compile(r"experiment_(\d+)")
+_METADATA_EVENT = re.compile(r"experiment_(\d+)_metadata")
+_PARAMETERS_EVENT = re.compile(r"experiment_params_(\d+)")
+_FIT_EVENT = re.compile(r"experiment_fit_(\d+)")
+
+# Rough CPython memory footprint of a dict item holding a scalar and of a list item
+# holding a float, used to keep the cache within its configured size.
+_DICT_ITEM_BYTES = 100
+_LIST_ITEM_BYTES = 32
+
+
+class ExperimentDataCacheStats(TypedDict):
+    """Usage statistics of the experiment data cache."""
+
+    jobs: int
+    """Number of cached jobs."""
+    bytes: int
+    """Estimated memory used by the cached data."""
+    max_jobs: int
+    """Configured maximum number of cached jobs."""
+    max_bytes: int
+    """Configured maximum estimated memory usage."""
+    hits: int
+    """Number of requests answered from the cache."""
+    misses: int
+    """Number of requests that read the HDF5 file."""
+    hit_ratio: float
+    """Fraction of requests answered from the cache."""
+    evictions: int
+    """Number of jobs dropped to stay within the limits."""
+
+
+@dataclass
+class _CacheEntry:
+    data: ExperimentData
+    bytes: int
+
+
+@dataclass
+class _Loading:
+    events: list[EmitEvent] = field(default_factory=list)
+    """Events of the job received while its data was being read."""
+
+
+def _data_point_bytes(data_point: dict[str, Any]) -> int:
+    number_of_items = (
+        len(data_point["scan_params"])
+        + 1  # timestamp
+        + len(data_point["result_channels"])
+        + len(data_point["shot_channels"])
+        + len(data_point["vector_channels"])
+    )
+    number_of_list_items = sum(
+        len(values) for values in data_point["shot_channels"].values()
+    ) + sum(len(values) for values in data_point["vector_channels"].values())
+    return number_of_items * _DICT_ITEM_BYTES + number_of_list_items * _LIST_ITEM_BYTES
+
+
+def _experiment_data_bytes(data: ExperimentData) -> int:
+    number_of_items = sum(
+        len(values)
+        for channels in (
+            data.scan_parameters,
+            data.result_channels,
+            data.shot_channels,
+            data.vector_channels,
+        )
+        for values in channels.values()
+    )
+    number_of_list_items = sum(
+        len(value)
+        for channels in (data.shot_channels, data.vector_channels)
+        for values in channels.values()
+        for value in values.values()
+    )
+    return number_of_items * _DICT_ITEM_BYTES + number_of_list_items * _LIST_ITEM_BYTES
+
+
+def _transfer_bytes_per_point(data: ExperimentData) -> int:
+    """Estimate the serialised size of a data point.
+
+    In-memory counterpart of the HDF5-based estimate used by
+    [get_experiment_data_by_job_id][icon.server.data_access.repositories.experiment_data_repository.ExperimentDataRepository.get_experiment_data_by_job_id].
+    """
+    number_of_points = max(len(data.scan_parameters.get("timestamp", {})), 1)
+    bytes_per_point = (
+        8 * len(data.result_channels)
+        + 8 * max(len(data.scan_parameters) - 1, 0)
+        + 26  # timestamp
+        + sum(
+            8 * len(next(iter(values.values()), ()))
+            for values in data.shot_channels.values()
+        )
+        + sum(
+            8 * len(value)
+            for values in data.vector_channels.values()
+            for value in values.values()
+        )
+        // number_of_points
+    )
+    return max(bytes_per_point * 2, 1)
+
+
+def _is_complete(data: ExperimentData) -> bool:
+    """Return True if *data* holds all data points of the job."""
+    timestamps = data.scan_parameters.get("timestamp", {})
+    return len(timestamps) == data.total_data_points
+
+
+def _snapshot(data: ExperimentData, *, start_index: int) -> ExperimentData:
+    """Copy the data points from *start_index* on, so the cache can keep changing."""
+
+    def select(values: dict[int, Any]) -> dict[int, Any]:
+        if start_index == 0:
+            return dict(values)
+        return {index: value for index, value in values.items() if index >= start_index}
+
+    return ExperimentData(
+        plot_windows={
+            "result_channels": list(data.plot_windows["result_channels"]),
+            "shot_channels": list(data.plot_windows["shot_channels"]),
+            "vector_channels": list(data.plot_windows["vector_channels"]),
+        },
+        shot_channels={name: select(v) for name, v in data.shot_channels.items()},
+        result_channels={name: select(v) for name, v in data.result_channels.items()},
+        vector_channels={name: select(v) for name, v in data.vector_channels.items()},
+        scan_parameters={name: select(v) for name, v in data.scan_parameters.items()},
+        json_sequences=list(data.json_sequences),
+        realtime_scan=data.realtime_scan,
+        parameters=dict(data.parameters),
+        total_data_points=data.total_data_points,
+        fits=dict(data.fits),
+    )
+
+
+def _apply_data_point(data: ExperimentData, data_point: dict[str, Any]) -> None:
+    """Add a data point the same way it ends up in a freshly read `ExperimentData`."""
+    index: int = data_point["index"]
+
+    data.scan_parameters.setdefault("timestamp", {})[index] = data_point["timestamp"]
+    for name, value in data_point["scan_params"].items():
+        data.scan_parameters.setdefault(name, {})[index] = float(value)
+    for name, value in data_point["result_channels"].items():
+        data.result_channels.setdefault(name, {})[index] = float(value)
+    for name, values in data_point["shot_channels"].items():
+        data.shot_channels.setdefault(name, {})[index] = [float(v) for v in values]
+    for name, values in data_point["vector_channels"].items():
+        data.vector_channels.setdefault(name, {})[index] = [float(v) for v in values]
+
+    sequence_json: str = data_point["sequence_json"]
+    if not data.json_sequences or data.json_sequences[-1][1] != sequence_json:
+        data.json_sequences.append([index, sequence_json])
+
+    data.total_data_points = max(data.total_data_points, index + 1)
+
+
+def _apply_fit(data: ExperimentData, fit: dict[str, Any]) -> None:
+    if fit.get("deleted"):
+        data.fits.pop(fit["result_channel"], None)
+    elif fit.get("success"):
+        data.fits[fit["result_channel"]] = fit
+
+
+class ExperimentDataCache:
+    """Bounded in-memory LRU cache of `ExperimentData` keyed by job ID.
+
+    Data is read from the HDF5 file once and then kept up to date from the events
+    that the data writers put on the Socket.IO emit queue (data points, parameter
+    updates and fits), so neither finished nor running jobs are re-read while cached.
+    A new metadata event (i.e. the job's file is re-initialised) drops the job.
+
+    The cache is bounded by an estimate of its memory usage and by the number of
+    jobs (see `data.experiment_data_cache` in the configuration). Jobs too large to
+    fit are served from the file without being cached.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[int, _CacheEntry] = OrderedDict()
+        self._loading: dict[int, _Loading] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return get_config().data.experiment_data_cache.max_bytes
+
+    @property
+    def max_jobs(self) -> int:
+        return get_config().data.experiment_data_cache.max_jobs
+
+    def get_experiment_data_by_job_id(
+        self, *, job_id: int, max_transfer_bytes: int = 50_000_000
+    ) -> ExperimentData:
+        """Return the data of a job, reading its HDF5 file only on a cache miss.
+
+        Same result as
+        [ExperimentDataRepository.get_experiment_data_by_job_id][icon.server.data_access.repositories.experiment_data_repository.ExperimentDataRepository.get_experiment_data_by_job_id].
+
+        Args:
+            job_id: Job identifier.
+            max_transfer_bytes: Approximate cap on the serialised payload size in
+                bytes. Defaults to 50 MB.
+
+        Returns:
+            A copy of the (possibly truncated) experiment data.
+        """
+        with self._lock:
+            entry = self._entries.get(job_id)
+            if entry is not None:
+                self._hits += 1
+                self._entries.move_to_end(job_id)
+                return self._snapshot(entry.data, max_transfer_bytes)
+            self._misses += 1
+            loading = job_id not in self._loading
+            if loading:
+                self._loading[job_id] = _Loading()
+
+        try:
+            data = ExperimentDataRepository.get_experiment_data_by_job_id(
+                job_id=job_id,
+                max_transfer_bytes=max(self.max_bytes, max_transfer_bytes),
+            )
+        except Exception:
+            if loading:
+                with self._lock:
+                    self._loading.pop(job_id, None)
+            raise
+
+        with self._lock:
+            if loading:
+                self._finish_loading(job_id, data)
+            return self._snapshot(data, max_transfer_bytes)
+
+    def _finish_loading(self, job_id: int, data: ExperimentData) -> None:
+        """Catch up on the events received while reading and insert the data."""
+        pending = self._loading.pop(job_id, _Loading())
+        if any(_METADATA_EVENT.fullmatch(event["event"]) for event in pending.events):
+            return
+        for event in pending.events:
+            self._apply_event(data, event)
+        self._insert(job_id, data)
+
+    def _snapshot(
+        self, data: ExperimentData, max_transfer_bytes: int
+    ) -> ExperimentData:
+        max_data_points = max_transfer_bytes // _transfer_bytes_per_point(data)
+        start_index = max(0, data.total_data_points - max_data_points)
+        return _snapshot(data, start_index=start_index)
+
+    def _insert(self, job_id: int, data: ExperimentData) -> None:
+        if not _is_complete(data) or data.total_data_points == 0:
+            # truncated or not written yet, not worth keeping
+            return
+        size = _experiment_data_bytes(data)
+        if size > self.max_bytes:
+            logger.debug("Not caching job %d (~%d bytes)", job_id, size)
+            return
+        self._entries[job_id] = _CacheEntry(data=data, bytes=size)
+        self._bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._entries and (
+            self._bytes > self.max_bytes or len(self._entries) > self.max_jobs
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.bytes
+            self._evictions += 1
+
+    def _drop(self, job_id: int) -> None:
+        entry = self._entries.pop(job_id, None)
+        if entry is not None:
+            self._bytes -= entry.bytes
+
+    def apply_event(self, emit_event: EmitEvent) -> None:
+        """Update the cached data of a job from an event of the emit queue.
+
+        Events that do not concern experiment data or uncached jobs are ignored.
+        """
+        event = emit_event["event"]
+        if not event.startswith("experiment_"):
+            return
+        match = (
+            _DATA_POINT_EVENT.fullmatch(event)
+            or _METADATA_EVENT.fullmatch(event)
+            or _PARAMETERS_EVENT.fullmatch(event)
+            or _FIT_EVENT.fullmatch(event)
+        )
+        if match is None:
+            return
+        job_id = int(match.group(1))
+
+        with self._lock:
+            if job_id in self._loading:
+                self._loading[job_id].events.append(emit_event)
+            entry = self._entries.get(job_id)
+            if entry is None:
+                return
+            if match.re is _METADATA_EVENT:
+                self._drop(job_id)
+                return
+            try:
+                size_change = self._apply_event(entry.data, emit_event)
+            except (KeyError, TypeError, ValueError):
+                logger.exception("Dropping cached data of job %d", job_id)
+                self._drop(job_id)
+                return
+            entry.bytes += size_change
+            self._bytes += size_change
+            self._evict()
+
+    @staticmethod
+    def _apply_event(data: ExperimentData, emit_event: EmitEvent) -> int:
+        """Apply an experiment event to *data* and return the estimated size change."""
+        event = emit_event["event"]
+        if _DATA_POINT_EVENT.fullmatch(event):
+            _apply_data_point(data, emit_event["data"])
+            return _data_point_bytes(emit_event["data"])
+        if _PARAMETERS_EVENT.fullmatch(event):
+            for param_id, value in emit_event["data"].items():
+                data.parameters[param_id] = ParameterValue(**value)
+        elif _FIT_EVENT.fullmatch(event):
+            _apply_fit(data, emit_event["data"])
+        return 0
+
+    def get_stats(self) -> ExperimentDataCacheStats:
+        """Return the usage statistics of the cache."""
+        with self._lock:
+            requests = self._hits + self._misses
+            return {
+                "jobs": len(self._entries),
+                "bytes": self._bytes,
+                "max_jobs": self.max_jobs,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": self._hits / requests if requests else 0.0,
+                "evictions": self._evictions,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached data."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+experiment_data_cache = ExperimentDataCache()
+"""Experiment data cache of the API process, fed by the emit worker."""
@@ -2,18 +2,21 @@ import json
 import logging
 import threading
 import time
+from collections import OrderedDict
 from collections.abc import Iterator
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
+from typing import TYPE_CHECKING, Any, Literal, NotRequired, TypedDict, cast
 
 import h5py  # type: ignore
 import numpy as np
 import numpy.typing as npt
 
 from icon.config.config import get_config
+from icon.config.latest import ShotChannelDtype
+from icon.serialization.typed_array import encode_arrays
 from icon.server.data_access.db_context.influxdb_v1 import DatabaseValueType
 from icon.server.data_access.models.sqlite.scan_parameter import (
     ScanParameter,
@@ -22,6 +25,11 @@ from icon.server.data_access.models.sqlite.scan_parameter import (
 from icon.server.data_access.repositories.job_repository import JobRepository
 from icon.server.data_access.repositories.job_run_repository import JobRunRepository
 from icon.server.fitting.fit_runner import FitResult
+from icon.server.post_processing.shot_statistics import (
+    ShotStatistics,
+    compute_shot_statistics,
+)
+from icon.server.utils.decimation import DecimationMethod, decimate
 from icon.server.web_server.socketio_emit_queue import emit_queue
 
 if TYPE_CHECKING:
@@ -89,6 +97,8 @@ class ReadoutMetadata(TypedDict):
     """List of `PlotWindowMetadata` of shot channels"""
     vector_channel_windows: list[PlotWindowMetadata]
     """List of `PlotWindowMetadata` of vector channels"""
+    shot_channel_dtypes: NotRequired[dict[str, ShotChannelDtype]]
+    """Optional storage dtype per shot channel, e.g. "bool" for binary readouts"""
 
 
 class PlotWindowsDict(TypedDict):
@@ -134,6 +144,69 @@ class ExperimentData:
     """Fit results keyed by result channel name."""
 
 
+@dataclass
+class VectorChannelColumns:
+    """Vector channel data as flat arrays (compressed sparse row layout)."""
+
+    index: npt.NDArray[np.int64]
+    """Data point index of each stored vector."""
+    offsets: npt.NDArray[np.int64]
+    """Start of each vector in `values`, followed by the total number of values."""
+    values: npt.NDArray[np.float64]
+    """Concatenated vector values."""
+
+
+@dataclass
+class ColumnarExperimentData:
+    """Experiment data with one flat array per channel instead of per-index dicts.
+
+    All per-data-point arrays are aligned with `index`. Shot channels are 2-D arrays
+    of shape `(len(index), number_of_shots)`.
+    """
+
+    plot_windows: PlotWindowsDict
+    """Plot window metadata grouped by channel class."""
+    index: npt.NDArray[np.int64]
+    """Indices of the returned data points."""
+    timestamps: npt.NDArray[np.bytes_]
+    """Acquisition timestamp of each data point (fixed-width ISO strings)."""
+    scan_parameters: dict[str, npt.NDArray[np.float64]]
+    """Scan parameter values as param_id -> array."""
+    result_channels: dict[str, npt.NDArray[np.float64]]
+    """Result channels as channel_name -> array."""
+    shot_channels: dict[str, npt.NDArray[Any]]
+    """Shot channels as channel_name -> 2-D array (data points x shots) in their
+    storage dtype."""
+    vector_channels: dict[str, VectorChannelColumns]
+    """Vector channels as channel_name -> flat vector columns."""
+    json_sequences: list[list[int | str]]
+    """List of [index, sequence_json] pairs."""
+    realtime_scan: bool
+    """True if the experiment has a realtime scan parameter."""
+    parameters: dict[str, ParameterValue]
+    """Mapping of parameter id to its last stored value."""
+    total_data_points: int
+    """Total number of data points in the HDF5 file (before truncation)."""
+    fits: dict[str, dict[str, object]]
+    """Fit results keyed by result channel name."""
+
+
+@dataclass
+class DecimatedResultChannel:
+    """Downsampled view of a result channel for plotting."""
+
+    index: npt.NDArray[np.int64]
+    """Data point indices of the selected points."""
+    x: npt.NDArray[np.float64]
+    """X values of the selected points (scan parameter value or data point index)."""
+    y: npt.NDArray[np.float64]
+    """Result channel values of the selected points."""
+    points_in_range: int
+    """Number of data points in the requested range before decimation."""
+    total_data_points: int
+    """Total number of data points in the HDF5 file."""
+
+
 def get_filename_by_job_id(job_id: int) -> str:
     """Return the HDF5 filename for a job.
 
@@ -275,6 +348,127 @@ def write_results_to_dataset(
     result_dataset[data_point_index] = tuple(result_channels[k] for k in sorted_keys)
 
 
+SHOT_CHANNEL_DTYPES_ATTR = "Shot channel dtypes"
+"""Attribute of the 'shot_channels' group holding the declared dtype per channel."""
+BIT_PACKED_SHOTS_ATTR = "bit_packed_shots"
+"""Attribute of bit-packed shot datasets holding the number of shots per row."""
+
+
+def _smallest_shot_dtype(values: npt.NDArray[Any]) -> ShotChannelDtype:
+    """Return the smallest unsigned integer dtype holding all values, or float64."""
+    if values.size == 0:
+        return "uint8"
+    if values.min() < 0 or not np.array_equal(values, np.round(values)):
+        return "float64"
+    maximum = values.max()
+    for dtype in ("uint8", "uint16", "uint32"):
+        if maximum <= np.iinfo(dtype).max:
+            return cast("ShotChannelDtype", dtype)
+    return "float64"
+
+
+def _shot_values_fit(dataset: h5py.Dataset, values: npt.NDArray[Any]) -> bool:
+    """Return True if `values` can be stored in `dataset` without loss."""
+    if BIT_PACKED_SHOTS_ATTR in dataset.attrs:
+        return bool(np.isin(values, (0, 1)).all())
+    if dataset.dtype.kind == "f":
+        return True
+    smallest = _smallest_shot_dtype(values)
+    return (
+        smallest != "float64" and np.dtype(smallest).itemsize <= dataset.dtype.itemsize
+    )
+
+
+def _create_shot_dataset(
+    shot_group: h5py.Group,
+    key: str,
+    *,
+    dtype: ShotChannelDtype,
+    number_of_data_points: int,
+    number_of_shots: int,
+) -> h5py.Dataset:
+    if dtype == "bool":
+        packed_shots = -(-number_of_shots // 8)
+        dataset = shot_group.create_dataset(
+            key,
+            shape=(number_of_data_points, packed_shots),
+            maxshape=(None, packed_shots),
+            chunks=True,
+            dtype=np.uint8,
+            compression="gzip",
+            compression_opts=9,
+        )
+        dataset.attrs[BIT_PACKED_SHOTS_ATTR] = number_of_shots
+        return dataset
+    return shot_group.create_dataset(
+        key,
+        shape=(number_of_data_points, number_of_shots),
+        maxshape=(None, number_of_shots),
+        chunks=True,
+        dtype=np.dtype(dtype),
+        compression="gzip",
+        compression_opts=9,
+    )
+
+
+class ShotValuesDoNotFitError(Exception):
+    """Raised when shot values do not fit the dtype of their existing dataset."""
+
+    def __init__(self, key: str, values: npt.NDArray[Any]) -> None:
+        super().__init__(f"Values of shot channel {key!r} do not fit its dtype")
+        self.key = key
+        self.values = values
+
+
+def widen_shot_dataset(
+    shot_group: h5py.Group, key: str, values: npt.NDArray[Any]
+) -> h5py.Dataset:
+    """Re-create a shot dataset with a dtype that also holds `values`.
+
+    Deletes the dataset, so the file must not be in SWMR mode.
+    """
+    dataset = cast("h5py.Dataset", shot_group[key])
+    existing = read_shot_dataset(dataset)
+    dtype = _smallest_shot_dtype(np.concatenate((existing.ravel(), values)))
+    logger.warning(
+        "Values of shot channel %r do not fit %s, converting to %s",
+        key,
+        "bit-packed bool" if BIT_PACKED_SHOTS_ATTR in dataset.attrs else dataset.dtype,
+        dtype,
+    )
+    number_of_shots = int(dataset.attrs.get(BIT_PACKED_SHOTS_ATTR, dataset.shape[1]))
+    del shot_group[key]
+    widened = _create_shot_dataset(
+        shot_group,
+        key,
+        dtype=dtype,
+        number_of_data_points=existing.shape[0],
+        number_of_shots=number_of_shots,
+    )
+    widened[...] = existing
+    return widened
+
+
+def read_shot_dataset(
+    dataset: h5py.Dataset, start_index: int = 0, stop_index: int | None = None
+) -> npt.NDArray[Any]:
+    """Read rows of a shot channel dataset, unpacking bit-packed readouts.
+
+    Args:
+        dataset: Shot channel dataset of shape (data points, shots).
+        start_index: First row to read.
+        stop_index: Optional exclusive end row.
+
+    Returns:
+        Array of shape (rows, shots) in the stored integer (or float) dtype.
+    """
+    rows = cast("npt.NDArray[Any]", dataset[start_index:stop_index])
+    number_of_shots = dataset.attrs.get(BIT_PACKED_SHOTS_ATTR)
+    if number_of_shots is None:
+        return rows
+    return np.unpackbits(rows, axis=1, count=int(number_of_shots))
+
+
 def write_shot_channels_to_datasets(
     h5file: h5py.File,
     data_point_index: int,
@@ -284,6 +478,15 @@ def write_shot_channels_to_datasets(
 ) -> None:
     """Write per-shot data into datasets under the 'shot_channels' group.
 
+    Shot channels are stored in the dtype declared in the group's
+    `SHOT_CHANNEL_DTYPES_ATTR` attribute ("bool" is bit-packed). Undeclared
+    channels of non-negative integers are stored as uint16, anything else as
+    float64.
+
+    Raises:
+        ShotValuesDoNotFitError: If the values do not fit an existing dataset, which
+            then has to be widened with [widen_shot_dataset][..widen_shot_dataset].
+
     Args:
         h5file: Open HDF5 file handle.
         data_point_index: Index of the current data point.
@@ -292,20 +495,98 @@ def write_shot_channels_to_datasets(
         number_of_shots: Expected number of shots per channel.
     """
     shot_group = h5file.require_group("shot_channels")
+    declared_dtypes: dict[str, ShotChannelDtype] = json.loads(
+        cast("str", shot_group.attrs.get(SHOT_CHANNEL_DTYPES_ATTR, "{}"))
+    )
     for key, value in shot_channels.items():
-        shot_dataset = shot_group.require_dataset(
-            key,
-            shape=(number_of_data_points, number_of_shots),
-            maxshape=(None, number_of_shots),
-            chunks=True,
-            dtype=np.float64,
-            compression="gzip",
-            compression_opts=9,
-        )
+        values = np.asarray(value)
+        if key not in shot_group:
+            smallest = _smallest_shot_dtype(values)
+            shot_dataset = _create_shot_dataset(
+                shot_group,
+                key,
+                dtype=declared_dtypes.get(
+                    key, "uint16" if smallest in ("uint8", "uint16") else smallest
+                ),
+                number_of_data_points=number_of_data_points,
+                number_of_shots=number_of_shots,
+            )
+        else:
+            shot_dataset = cast("h5py.Dataset", shot_group[key])
+        if not _shot_values_fit(shot_dataset, values):
+            raise ShotValuesDoNotFitError(key, values)
 
         if data_point_index >= number_of_data_points:
             resize_dataset(shot_dataset, next_index=data_point_index, axis=0)
-        shot_dataset[data_point_index] = value
+        if BIT_PACKED_SHOTS_ATTR in shot_dataset.attrs:
+            shot_dataset[data_point_index] = np.packbits(values.astype(bool))
+        else:
+            shot_dataset[data_point_index] = values
+
+
+_SHOT_STATISTICS_FIELDS = ("histogram", "mean", "variance", "populations")
+
+
+def _get_shot_statistics_parameters(
+    channel_group: h5py.Group,
+) -> tuple[int, list[float]]:
+    return (
+        int(cast("int", channel_group.attrs["histogram_bins"])),
+        [float(t) for t in cast("npt.NDArray[Any]", channel_group.attrs["thresholds"])],
+    )
+
+
+def write_shot_statistics_to_datasets(
+    h5file: h5py.File,
+    data_point_index: int,
+    shot_channels: dict[str, list[int]],
+) -> None:
+    """Compute and store per-data-point statistics of the shot channels.
+
+    For each shot channel, a group under 'shot_statistics' holds one dataset per
+    [ShotStatistics][icon.server.post_processing.shot_statistics.ShotStatistics]
+    field with the data points along the first axis. Binning and thresholds are
+    taken from the configuration when the group is created and stored as group
+    attributes, so they stay fixed for the whole job.
+
+    Args:
+        h5file: Open HDF5 file handle.
+        data_point_index: Index of the current data point.
+        shot_channels: Mapping of channel to per-shot integers.
+    """
+    config = get_config().data.shot_statistics
+    statistics_group = h5file.require_group("shot_statistics")
+    for key, value in shot_channels.items():
+        channel_group = cast("h5py.Group | None", statistics_group.get(key))
+        if channel_group is None:
+            channel_group = statistics_group.create_group(key)
+            channel_group.attrs["histogram_bins"] = config.histogram_bins
+            channel_group.attrs["thresholds"] = config.channel_thresholds.get(
+                key, config.thresholds
+            )
+        histogram_bins, thresholds = _get_shot_statistics_parameters(channel_group)
+        statistics = compute_shot_statistics(
+            np.asarray(value)[np.newaxis],
+            histogram_bins=histogram_bins,
+            thresholds=thresholds,
+        )
+
+        for name in _SHOT_STATISTICS_FIELDS:
+            row = cast("npt.NDArray[Any]", getattr(statistics, name))[0]
+            dataset = cast("h5py.Dataset | None", channel_group.get(name))
+            if dataset is None:
+                dataset = channel_group.create_dataset(
+                    name,
+                    shape=(0, *row.shape),
+                    maxshape=(None, *row.shape),
+                    chunks=True,
+                    dtype=row.dtype,
+                    compression="gzip",
+                    compression_opts=9,
+                )
+            if data_point_index >= dataset.shape[0]:
+                resize_dataset(dataset, next_index=data_point_index, axis=0)
+            dataset[data_point_index] = row
 
 
 def write_vector_channels_to_datasets(
@@ -334,6 +615,214 @@ def write_vector_channels_to_datasets(
             )
 
 
+def _encode_data_point_binary(data_point: ExperimentDataPoint) -> dict[str, Any]:
+    """Serialise a data point with shot and vector channels as binary arrays.
+
+    Used for clients that opted into binary experiment data (see
+    [encode_arrays][icon.serialization.typed_array.encode_arrays]).
+    """
+    data = asdict(data_point)
+    data["shot_channels"] = {
+        name: np.asarray(values) for name, values in data_point.shot_channels.items()
+    }
+    data["vector_channels"] = {
+        name: np.asarray(values, dtype=np.float64)
+        for name, values in data_point.vector_channels.items()
+    }
+    return encode_arrays(data, binary=True)
+
+
+PARAMETER_NAMES_DATASET = "parameter_names"
+"""Dataset of parameter ids; the position of an id is its parameter index."""
+PARAMETER_HISTORY_DATASET = "parameter_history"
+"""Append-only table of (timestamp, parameter index, value) rows."""
+
+_PARAMETER_TYPES: tuple[type[float | int | bool | str], ...] = (float, int, bool, str)
+"""Python type of a parameter history row, indexed by its `type` field."""
+_PARAMETER_HISTORY_DTYPE = np.dtype(
+    [
+        ("timestamp", "S26"),
+        ("parameter", np.uint32),
+        ("type", np.uint8),
+        ("value", np.float64),
+        ("text", h5py.string_dtype()),
+    ]
+)
+_MAX_PARAMETER_HISTORY_STATES = 16
+
+
+@dataclass
+class _ParameterHistoryState:
+    """In-memory copy of the parameter names and last values of a job file."""
+
+    names: dict[str, int]
+    last_values: dict[int, DatabaseValueType]
+    number_of_rows: int
+
+
+_parameter_history_states: OrderedDict[str, _ParameterHistoryState] = OrderedDict()
+"""Parameter history states of recently written files, keyed by path."""
+
+
+def _parameter_type_code(value: DatabaseValueType) -> int:
+    # bool is a subclass of int, so check it first
+    for code in (2, 1, 0, 3):
+        if isinstance(value, _PARAMETER_TYPES[code]):
+            return code
+    raise TypeError(f"Unsupported parameter type: {type(value)}")
+
+
+def _last_parameter_rows(
+    history: h5py.Dataset,
+) -> tuple[npt.NDArray[Any], npt.NDArray[np.intp]]:
+    """Read the numeric columns and return them with the last row of each parameter."""
+    rows = cast(
+        "npt.NDArray[Any]",
+        history.fields(["timestamp", "parameter", "type", "value"])[:],
+    )
+    # first occurrence in the reversed table is the last update of a parameter
+    _, reversed_index = np.unique(rows["parameter"][::-1], return_index=True)
+    last_rows = np.sort(len(rows) - 1 - reversed_index)
+    return rows, last_rows
+
+
+def _decode_parameter_values(
+    history: h5py.Dataset, rows: npt.NDArray[Any], selected: npt.NDArray[np.intp]
+) -> list[DatabaseValueType]:
+    """Convert the selected (sorted) rows of the parameter history to Python values."""
+    is_text = rows["type"][selected] == _PARAMETER_TYPES.index(str)
+    texts = iter(
+        history.fields("text")[selected[is_text]].tolist() if is_text.any() else []
+    )
+    values: list[DatabaseValueType] = []
+    for type_code, value in zip(
+        rows["type"][selected].tolist(), rows["value"][selected].tolist(), strict=True
+    ):
+        parameter_type = _PARAMETER_TYPES[type_code]
+        if parameter_type is str:
+            text = next(texts)
+            values.append(text.decode() if isinstance(text, bytes) else text)
+        else:
+            values.append(parameter_type(value))
+    return values
+
+
+def _read_parameter_names(names_dataset: h5py.Dataset) -> list[str]:
+    return [
+        name.decode() if isinstance(name, bytes) else name
+        for name in names_dataset[:].tolist()
+    ]
+
+
+def _read_parameter_history_state(h5file: h5py.File) -> _ParameterHistoryState:
+    names_dataset = cast("h5py.Dataset | None", h5file.get(PARAMETER_NAMES_DATASET))
+    history = cast("h5py.Dataset | None", h5file.get(PARAMETER_HISTORY_DATASET))
+    if names_dataset is None or history is None:
+        return _ParameterHistoryState(names={}, last_values={}, number_of_rows=0)
+
+    names = _read_parameter_names(names_dataset)
+    rows, last_rows = _last_parameter_rows(history)
+    values = _decode_parameter_values(history, rows, last_rows)
+    return _ParameterHistoryState(
+        names={name: index for index, name in enumerate(names)},
+        last_values=dict(
+            zip(rows["parameter"][last_rows].tolist(), values, strict=True)
+        ),
+        number_of_rows=history.shape[0],
+    )
+
+
+def _get_parameter_history_state(h5file: h5py.File) -> _ParameterHistoryState:
+    """Return the cached state of a file, re-reading it if the file changed."""
+    key = str(Path(h5file.filename).resolve())
+    history = cast("h5py.Dataset | None", h5file.get(PARAMETER_HISTORY_DATASET))
+    number_of_rows = history.shape[0] if history is not None else 0
+
+    state = _parameter_history_states.get(key)
+    if state is None or state.number_of_rows != number_of_rows:
+        state = _read_parameter_history_state(h5file)
+        _parameter_history_states[key] = state
+    _parameter_history_states.move_to_end(key)
+    while len(_parameter_history_states) > _MAX_PARAMETER_HISTORY_STATES:
+        _parameter_history_states.popitem(last=False)
+    return state
+
+
+def write_parameter_values_to_history(
+    h5file: h5py.File,
+    timestamp: str,
+    parameter_values: dict[str, DatabaseValueType],
+) -> dict[str, ParameterValue]:
+    """Append the parameters whose value changed to the parameter history table.
+
+    Changes are detected against an in-memory copy of the last value of each
+    parameter, so no per-parameter reads are needed.
+
+    Args:
+        h5file: Open HDF5 file handle.
+        timestamp: ISO timestamp string.
+        parameter_values: Mapping of parameter id to value.
+
+    Returns:
+        The appended updates.
+    """
+    state = _get_parameter_history_state(h5file)
+
+    new_names: list[str] = []
+    rows: list[tuple[bytes, int, int, float, str]] = []
+    updates: dict[str, ParameterValue] = {}
+    for param_id, value in parameter_values.items():
+        index = state.names.get(param_id)
+        if index is None:
+            index = len(state.names)
+            state.names[param_id] = index
+            new_names.append(param_id)
+        elif index in state.last_values and state.last_values[index] == value:
+            continue
+
+        type_code = _parameter_type_code(value)
+        rows.append(
+            (
+                timestamp.encode(),
+                index,
+                type_code,
+                float(value) if type_code != _PARAMETER_TYPES.index(str) else np.nan,  # type: ignore[arg-type]
+                value if isinstance(value, str) else "",
+            )
+        )
+        state.last_values[index] = value
+        updates[param_id] = ParameterValue(timestamp, value)
+
+    if new_names:
+        names_dataset = h5file.require_dataset(
+            PARAMETER_NAMES_DATASET,
+            shape=(0,),
+            maxshape=(None,),
+            chunks=(256,),
+            dtype=h5py.string_dtype(),
+        )
+        start = names_dataset.shape[0]
+        names_dataset.resize(start + len(new_names), axis=0)
+        names_dataset[start:] = new_names
+
+    if rows:
+        history = h5file.require_dataset(
+            PARAMETER_HISTORY_DATASET,
+            shape=(0,),
+            maxshape=(None,),
+            chunks=(1024,),
+            dtype=_PARAMETER_HISTORY_DTYPE,
+            compression="gzip",
+            compression_opts=4,
+        )
+        start = history.shape[0]
+        history.resize(start + len(rows), axis=0)
+        history[start:] = np.array(rows, dtype=_PARAMETER_HISTORY_DTYPE)
+        state.number_of_rows = start + len(rows)
+
+    return updates
+
+
 class ExperimentDataRepository:
     """Repository for HDF5-based experiment data.
 
@@ -421,6 +910,12 @@ class ExperimentDataRepository:
             shot_group.attrs["Plot window metadata"] = json.dumps(
                 readout_metadata["shot_channel_windows"]
             )
+            shot_group.attrs[SHOT_CHANNEL_DTYPES_ATTR] = json.dumps(
+                {
+                    **readout_metadata.get("shot_channel_dtypes", {}),
+                    **get_config().data.shot_channel_dtypes,
+                }
+            )
 
             vector_group = h5file.require_group("vector_channels")
             vector_group.attrs["Plot window metadata"] = json.dumps(
@@ -457,6 +952,29 @@ class ExperimentDataRepository:
         filename = get_filename_by_job_id(job_id)
         h5_path = Path(get_config().data.results_dir) / filename
 
+        try:
+            ExperimentDataRepository._write_data_point(h5_path, data_point)
+        except ShotValuesDoNotFitError as e:
+            with h5_open(h5_path, "a", swmr_write=False) as h5file:
+                widen_shot_dataset(h5file["shot_channels"], e.key, e.values)
+            ExperimentDataRepository._write_data_point(h5_path, data_point)
+
+        emit_queue.put(
+            {
+                "event": f"experiment_{job_id}",
+                "data": asdict(data_point),
+                "binary_data": _encode_data_point_binary(data_point),
+            }
+        )
+        emit_queue.put(
+            {
+                "event": "last_experiment_sequence",
+                "data": data_point.sequence_json,
+            }
+        )
+
+    @staticmethod
+    def _write_data_point(h5_path: Path, data_point: ExperimentDataPoint) -> None:
         with h5_open(h5_path, "a") as h5file:
             try:
                 number_of_shots: int = h5file.attrs["number_of_shots"]
@@ -490,6 +1008,12 @@ class ExperimentDataRepository:
                 number_of_shots=number_of_shots,
             )
 
+            write_shot_statistics_to_datasets(
+                h5file=h5file,
+                data_point_index=data_point.index,
+                shot_channels=data_point.shot_channels,
+            )
+
             write_vector_channels_to_datasets(
                 h5file=h5file,
                 data_point_index=data_point.index,
@@ -507,19 +1031,6 @@ class ExperimentDataRepository:
 
             logger.debug("Appended data to %s", h5_path)
 
-        emit_queue.put(
-            {
-                "event": f"experiment_{job_id}",
-                "data": asdict(data_point),
-            }
-        )
-        emit_queue.put(
-            {
-                "event": "last_experiment_sequence",
-                "data": data_point.sequence_json,
-            }
-        )
-
     @staticmethod
     def write_parameter_update_by_job_id(
         *,
@@ -527,10 +1038,11 @@ class ExperimentDataRepository:
         timestamp: str,
         parameter_values: dict[str, str | int | float | bool],
     ) -> None:
-        """Append parameter updates under the 'parameters' group.
+        """Append parameter updates to the parameter history table.
 
-        Creates a dataset per parameter storing (timestamp, value) entries.
-        Appends only when the value changed from the last entry.
+        Only parameters whose value changed since their last entry are appended, as
+        `(timestamp, parameter index, value)` rows of a single table (see
+        [write_parameter_values_to_history][..write_parameter_values_to_history]).
 
         Args:
             job_id: Job identifier.
@@ -539,38 +1051,10 @@ class ExperimentDataRepository:
         """
         filename = get_filename_by_job_id(job_id)
         h5_path = Path(get_config().data.results_dir) / filename
-        parameter_updates = {}
         with h5_open(h5_path, "a") as h5file:
-            parameters_group = h5file.require_group("parameters")
-
-            for param_id, value in parameter_values.items():
-                dtype = [("timestamp", "S26"), ("value", get_hdf5_dtype(value))]
-
-                if param_id in parameters_group:
-                    ds: h5py.Dataset = parameters_group[param_id]
-                    if ds.shape[0] > 0:
-                        last_entry = ds[-1]
-                        last_value = last_entry["value"]
-                        if isinstance(value, str):
-                            if last_value.decode() == value:
-                                continue
-                        elif last_value == value:
-                            continue
-
-                    index = ds.shape[0]
-                    resize_dataset(ds, next_index=index, axis=0)
-                else:
-                    ds = parameters_group.create_dataset(
-                        param_id,
-                        shape=(1,),
-                        maxshape=(None,),
-                        dtype=dtype,
-                    )
-                    index = 0
-
-                ds[index] = (timestamp.encode(), value)
-                parameter_updates[param_id] = ParameterValue(timestamp, value)
-
+            parameter_updates = write_parameter_values_to_history(
+                h5file, timestamp=timestamp, parameter_values=parameter_values
+            )
             logger.debug(
                 "Wrote parameter update for job %d at %s",
                 job_id,
@@ -586,7 +1070,7 @@ class ExperimentDataRepository:
         )
 
     @staticmethod
-    def get_experiment_data_by_job_id(  # noqa: C901
+    def get_experiment_data_by_job_id(
         *,
         job_id: int,
         max_transfer_bytes: int = 50_000_000,
@@ -598,6 +1082,11 @@ class ExperimentDataRepository:
         budget is estimated from HDF5 metadata (channel count, shots per
         channel) without reading actual data.
 
+        The file is opened as an SWMR reader, so this can be called while the
+        job is still running. Only data points counted in the
+        `number_of_data_points` attribute are returned, which excludes rows the
+        writer is still filling in.
+
         Args:
             job_id: Job identifier.
             max_transfer_bytes: Approximate cap on the serialised payload
@@ -606,22 +1095,7 @@ class ExperimentDataRepository:
         Returns:
             Experiment data payload suitable for the API.
         """
-        data = ExperimentData(
-            plot_windows={
-                "result_channels": [],
-                "shot_channels": [],
-                "vector_channels": [],
-            },
-            shot_channels={},
-            result_channels={},
-            vector_channels={},
-            scan_parameters={},
-            json_sequences=[],
-            realtime_scan=False,
-            parameters={},
-            total_data_points=0,
-            fits={},
-        )
+        data = _empty_experiment_data()
 
         filename = get_filename_by_job_id(job_id)
         h5_path = Path(get_config().data.results_dir) / filename
@@ -631,138 +1105,576 @@ class ExperimentDataRepository:
             return data
 
         with h5_open(h5_path, "r") as h5file:
-            data.realtime_scan = bool(h5file.attrs.get("realtime_scan", False))
+            total = int(h5file.attrs.get("number_of_data_points", 0))
+            start_index = _get_start_index_within_budget(
+                h5file, total=total, max_transfer_bytes=max_transfer_bytes
+            )
+
+            _read_data_points(h5file, data, start_index=start_index, stop_index=total)
+            data.json_sequences = _read_json_sequences(h5file)
+            data.parameters = extract_parameter_values(h5file)
+        return data
+
+    @staticmethod
+    def get_experiment_data_columns_by_job_id(
+        *,
+        job_id: int,
+        max_transfer_bytes: int = 50_000_000,
+    ) -> ColumnarExperimentData | None:
+        """Load stored data for a job in columnar layout.
+
+        Same selection of data points as
+        [get_experiment_data_by_job_id][..ExperimentDataRepository.get_experiment_data_by_job_id],
+        but channels are returned as flat NumPy arrays aligned with an index array
+        instead of `{index: value}` dicts. This avoids creating one Python object
+        per value and maps directly onto typed binary buffers.
 
+        Args:
+            job_id: Job identifier.
+            max_transfer_bytes: Approximate cap on the payload size in bytes.
+                Defaults to 50 MB.
+
+        Returns:
+            Columnar experiment data, or None if the job has no data file yet.
+        """
+        filename = get_filename_by_job_id(job_id)
+        h5_path = Path(get_config().data.results_dir) / filename
+
+        if not Path(h5_path).exists():
+            logger.warning("The file %s does not exist.", h5_path)
+            return None
+
+        with h5_open(h5_path, "r") as h5file:
             total = int(h5file.attrs.get("number_of_data_points", 0))
-            data.total_data_points = total
-
-            # Estimate bytes per data point from HDF5 metadata
-            shot_channels_group = cast("h5py.Group | None", h5file.get("shot_channels"))
-            result_channel_dataset = h5file.get("result_channels")
-            scan_parameters = cast("h5py.Dataset | None", h5file.get("scan_parameters"))
-
-            bytes_per_point = sum(
-                ds.shape[1] * ds.dtype.itemsize
-                for ds in (shot_channels_group or {}).values()
-            ) + sum(
-                ds.dtype.itemsize
-                for ds in (result_channel_dataset, scan_parameters)
-                if ds is not None
-            )
-
-            # Add vector channel size (average across all data points)
-            vector_channels_group = cast(
-                "h5py.Group | None", h5file.get("vector_channels")
-            )
-            total_vector_bytes = sum(
-                dataset.shape[0] * dataset.dtype.itemsize
-                for channel_group in (vector_channels_group or {}).values()
-                for dataset in cast("h5py.Group", channel_group).values()
-            )
-            if total > 0:
-                bytes_per_point += total_vector_bytes // total
-            # JSON serialisation roughly doubles the raw size
-            bytes_per_point = max(bytes_per_point * 2, 1)
-
-            max_data_points = max_transfer_bytes // bytes_per_point
-            start_index = max(0, total - max_data_points)
-            if start_index > 0:
-                logger.info(
-                    "Loading last %d of %d data points (~%d bytes/point, %d MB budget)",
-                    total - start_index,
-                    total,
-                    bytes_per_point,
-                    max_transfer_bytes // 1_000_000,
-                )
+            start_index = _get_start_index_within_budget(
+                h5file, total=total, max_transfer_bytes=max_transfer_bytes
+            )
+            return _read_data_point_columns(
+                h5file, start_index=start_index, stop_index=total
+            )
 
-            if scan_parameters is not None:
-                scan_parameters: npt.NDArray = scan_parameters[start_index:]  # type: ignore
-                data.scan_parameters = {
-                    param: {
-                        start_index + i: value[0].item().decode()
-                        if isinstance(value[0], np.bytes_)
-                        else value[0].item()
-                        for i, value in enumerate(scan_parameters[param])
-                    }
-                    for param in cast("tuple[str, ...]", scan_parameters.dtype.names)
-                }
+    @staticmethod
+    def get_experiment_data_since_index(
+        *,
+        job_id: int,
+        since_index: int,
+        until_index: int | None = None,
+    ) -> ExperimentData:
+        """Load only the data of a job that was added after a given data point.
 
-            if result_channel_dataset is not None:
-                plot_metadata = result_channel_dataset.attrs.get("Plot window metadata")
-                if plot_metadata:
-                    data.plot_windows["result_channels"] = json.loads(
-                        cast("str", plot_metadata)
-                    )
-                result_channels = cast(
-                    "npt.NDArray[Any]", result_channel_dataset[start_index:]
-                )  # type: ignore
-                data.result_channels = {
-                    channel_name: dict(
-                        enumerate(
-                            cast("list[float]", result_channels[channel_name].tolist()),
-                            start=start_index,
-                        )
-                    )
-                    for channel_name in cast(
-                        "tuple[str, ...]", result_channels.dtype.names
-                    )
-                }
+        Lets clients that already hold the first *since_index* data points (e.g. a
+        reconnecting frontend tab or a polling notebook) resync without reloading the
+        whole job. The returned payload contains:
 
-            # Convert shot channels into dicts with index as key
-            if shot_channels_group is not None:
-                plot_metadata = shot_channels_group.attrs.get("Plot window metadata")
-                if plot_metadata:
-                    data.plot_windows["shot_channels"] = json.loads(
-                        cast("str", plot_metadata)
-                    )
-                data.shot_channels = {
-                    key: dict(
-                        enumerate(value[start_index:].tolist(), start=start_index)
-                    )  # type: ignore
-                    for key, value in cast(
-                        "Sequence[tuple[str, h5py.Dataset]]",
-                        shot_channels_group.items(),
-                    )
-                }
+        - data points with `since_index <= index < until_index`,
+        - sequence JSON entries recorded within that index range,
+        - parameters updated after the timestamp of data point `since_index - 1`,
+        - all fit results, and
+        - the current `total_data_points`, so clients know whether to fetch more.
+
+        Args:
+            job_id: Job identifier.
+            since_index: Index of the first data point to return.
+            until_index: Optional exclusive upper bound on the returned indices.
+                Defaults to the number of data points currently stored.
+
+        Returns:
+            Experiment data payload restricted to the requested range.
+        """
+        data = _empty_experiment_data()
+
+        filename = get_filename_by_job_id(job_id)
+        h5_path = Path(get_config().data.results_dir) / filename
+
+        if not Path(h5_path).exists():
+            logger.warning("The file %s does not exist.", h5_path)
+            return data
 
-            if vector_channels_group is not None:
-                plot_metadata = vector_channels_group.attrs.get(
-                    "Plot window metadata", "[]"
+        with h5_open(h5_path, "r") as h5file:
+            total = int(h5file.attrs.get("number_of_data_points", 0))
+            stop_index = total if until_index is None else min(until_index, total)
+            start_index = min(max(since_index, 0), stop_index)
+
+            _read_data_points(
+                h5file, data, start_index=start_index, stop_index=stop_index
+            )
+            data.json_sequences = _read_json_sequences(
+                h5file, start_index=start_index, stop_index=stop_index
+            )
+            data.parameters = extract_parameter_values(
+                h5file, since=_get_data_point_timestamp(h5file, start_index - 1)
+            )
+        return data
+
+    @staticmethod
+    def get_decimated_result_channel(
+        *,
+        job_id: int,
+        result_channel: str,
+        target_points: int = 1000,
+        method: DecimationMethod = "lttb",
+        x_parameter: str | None = None,
+        x_range: tuple[float, float] | None = None,
+        start_index: int = 0,
+        stop_index: int | None = None,
+    ) -> DecimatedResultChannel | None:
+        """Load a downsampled view of a result channel.
+
+        Only the requested result channel (and scan parameter) columns are read. The
+        points are sorted by x and reduced to about `target_points` with
+        [decimate][icon.server.utils.decimation.decimate]. Zooming is done by
+        querying again with a narrower `x_range` or index range.
+
+        Args:
+            job_id: Job identifier.
+            result_channel: Name of the result channel.
+            target_points: Maximum number of returned points.
+            method: Decimation algorithm, "lttb" or "minmax".
+            x_parameter: Scan parameter used as x axis. Defaults to the data point
+                index.
+            x_range: Optional inclusive (min, max) range of x values.
+            start_index: First data point index to consider.
+            stop_index: Optional exclusive upper bound on the data point indices.
+
+        Returns:
+            The decimated channel, or None if the job has no data file or the
+            channel does not exist.
+        """
+        filename = get_filename_by_job_id(job_id)
+        h5_path = Path(get_config().data.results_dir) / filename
+
+        if not Path(h5_path).exists():
+            logger.warning("The file %s does not exist.", h5_path)
+            return None
+
+        with h5_open(h5_path, "r") as h5file:
+            total = int(h5file.attrs.get("number_of_data_points", 0))
+            stop_index = total if stop_index is None else min(stop_index, total)
+            start_index = min(max(start_index, 0), stop_index)
+
+            result_channels = cast("h5py.Dataset | None", h5file.get("result_channels"))
+            if result_channels is None or result_channel not in (
+                result_channels.dtype.names or ()
+            ):
+                return None
+            y = result_channels.fields(result_channel)[start_index:stop_index]
+            index = np.arange(start_index, stop_index, dtype=np.int64)
+            if x_parameter is None:
+                x = index.astype(np.float64)
+            else:
+                x = h5file["scan_parameters"].fields(x_parameter)[
+                    start_index:stop_index, 0
+                ]
+
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        mask = np.isfinite(x) & np.isfinite(y)
+        if x_range is not None:
+            mask &= (x >= x_range[0]) & (x <= x_range[1])
+        order = np.argsort(x[mask], kind="stable")
+        index, x, y = index[mask][order], x[mask][order], y[mask][order]
+
+        selected = decimate(x, y, target_points, method)
+        return DecimatedResultChannel(
+            index=index[selected],
+            x=x[selected],
+            y=y[selected],
+            points_in_range=len(index),
+            total_data_points=total,
+        )
+
+    @staticmethod
+    def get_shot_statistics_by_job_id(
+        *,
+        job_id: int,
+        start_index: int = 0,
+        stop_index: int | None = None,
+    ) -> dict[str, ShotStatistics] | None:
+        """Load the per-data-point shot statistics of a job.
+
+        Statistics are written together with each data point (see
+        [write_shot_statistics_to_datasets][..write_shot_statistics_to_datasets]).
+        For files written before they existed, they are computed from the shot
+        channels using the configured binning and thresholds.
+
+        Args:
+            job_id: Job identifier.
+            start_index: First data point index to return.
+            stop_index: Optional exclusive upper bound on the data point indices.
+
+        Returns:
+            Mapping of shot channel name to its statistics, or None if the job has no
+            data file yet.
+        """
+        filename = get_filename_by_job_id(job_id)
+        h5_path = Path(get_config().data.results_dir) / filename
+
+        if not Path(h5_path).exists():
+            logger.warning("The file %s does not exist.", h5_path)
+            return None
+
+        with h5_open(h5_path, "r") as h5file:
+            total = int(h5file.attrs.get("number_of_data_points", 0))
+            stop_index = total if stop_index is None else min(stop_index, total)
+            start_index = min(max(start_index, 0), stop_index)
+            return _read_shot_statistics(
+                h5file, start_index=start_index, stop_index=stop_index
+            )
+
+
+def _empty_experiment_data() -> ExperimentData:
+    return ExperimentData(
+        plot_windows={
+            "result_channels": [],
+            "shot_channels": [],
+            "vector_channels": [],
+        },
+        shot_channels={},
+        result_channels={},
+        vector_channels={},
+        scan_parameters={},
+        json_sequences=[],
+        realtime_scan=False,
+        parameters={},
+        total_data_points=0,
+        fits={},
+    )
+
+
+def _estimate_bytes_per_point(h5file: h5py.File, total: int) -> int:
+    """Estimate the serialised size of a single data point from HDF5 metadata."""
+    shot_channels_group = cast("h5py.Group | None", h5file.get("shot_channels"))
+    result_channel_dataset = h5file.get("result_channels")
+    scan_parameters = h5file.get("scan_parameters")
+
+    # shots are transferred as float64 irrespective of their storage dtype
+    bytes_per_point = sum(
+        int(ds.attrs.get(BIT_PACKED_SHOTS_ATTR, ds.shape[1])) * 8
+        for ds in (shot_channels_group or {}).values()
+    ) + sum(
+        ds.dtype.itemsize
+        for ds in (result_channel_dataset, scan_parameters)
+        if ds is not None
+    )
+
+    # Add vector channel size (average across all data points)
+    vector_channels_group = cast("h5py.Group | None", h5file.get("vector_channels"))
+    total_vector_bytes = sum(
+        dataset.shape[0] * dataset.dtype.itemsize
+        for channel_group in (vector_channels_group or {}).values()
+        for dataset in cast("h5py.Group", channel_group).values()
+    )
+    if total > 0:
+        bytes_per_point += total_vector_bytes // total
+    # JSON serialisation roughly doubles the raw size
+    return max(bytes_per_point * 2, 1)
+
+
+def _get_start_index_within_budget(
+    h5file: h5py.File, *, total: int, max_transfer_bytes: int
+) -> int:
+    """Return the first index of the last N data points that fit into the budget."""
+    bytes_per_point = _estimate_bytes_per_point(h5file, total)
+
+    max_data_points = max_transfer_bytes // bytes_per_point
+    start_index = max(0, total - max_data_points)
+    if start_index > 0:
+        logger.info(
+            "Loading last %d of %d data points (~%d bytes/point, %d MB budget)",
+            total - start_index,
+            total,
+            bytes_per_point,
+            max_transfer_bytes // 1_000_000,
+        )
+    return start_index
+
+
+def _read_data_points(
+    h5file: h5py.File,
+    data: ExperimentData,
+    *,
+    start_index: int,
+    stop_index: int,
+) -> None:
+    """Fill *data* with the data points in `[start_index, stop_index)`.
+
+    Also sets the file-level fields (realtime flag, total number of data points, plot
+    windows and fits), which are independent of the requested range.
+    """
+    data.realtime_scan = bool(h5file.attrs.get("realtime_scan", False))
+    data.total_data_points = int(h5file.attrs.get("number_of_data_points", 0))
+
+    scan_parameters = cast("h5py.Dataset | None", h5file.get("scan_parameters"))
+    if scan_parameters is not None:
+        scan_parameter_rows: npt.NDArray = scan_parameters[start_index:stop_index]  # type: ignore
+        data.scan_parameters = {
+            param: {
+                start_index + i: value[0].item().decode()
+                if isinstance(value[0], np.bytes_)
+                else value[0].item()
+                for i, value in enumerate(scan_parameter_rows[param])
+            }
+            for param in cast("tuple[str, ...]", scan_parameter_rows.dtype.names)
+        }
+
+    result_channel_dataset = h5file.get("result_channels")
+    if result_channel_dataset is not None:
+        plot_metadata = result_channel_dataset.attrs.get("Plot window metadata")
+        if plot_metadata:
+            data.plot_windows["result_channels"] = json.loads(
+                cast("str", plot_metadata)
+            )
+        result_channels = cast(
+            "npt.NDArray[Any]", result_channel_dataset[start_index:stop_index]
+        )  # type: ignore
+        data.result_channels = {
+            channel_name: dict(
+                enumerate(
+                    cast("list[float]", result_channels[channel_name].tolist()),
+                    start=start_index,
                 )
-                data.plot_windows["vector_channels"] = json.loads(
-                    cast("str", plot_metadata)
+            )
+            for channel_name in cast("tuple[str, ...]", result_channels.dtype.names)
+        }
+
+    # Convert shot channels into dicts with index as key
+    shot_channels_group = cast("h5py.Group | None", h5file.get("shot_channels"))
+    if shot_channels_group is not None:
+        plot_metadata = shot_channels_group.attrs.get("Plot window metadata")
+        if plot_metadata:
+            data.plot_windows["shot_channels"] = json.loads(cast("str", plot_metadata))
+        data.shot_channels = {
+            key: dict(
+                enumerate(
+                    read_shot_dataset(value, start_index, stop_index)
+                    .astype(np.float64)
+                    .tolist(),
+                    start=start_index,
                 )
-                data.vector_channels = {
-                    channel_name: {
-                        int(data_point): vector_dataset[:].tolist()
-                        for data_point, vector_dataset in cast(
-                            "Sequence[tuple[str, h5py.Dataset]]", vector_group.items()
-                        )
-                    }
-                    for channel_name, vector_group in cast(
-                        "Sequence[tuple[str, h5py.Group]]",
-                        vector_channels_group.items(),
-                    )
-                }
+            )  # type: ignore
+            for key, value in cast(
+                "Sequence[tuple[str, h5py.Dataset]]",
+                shot_channels_group.items(),
+            )
+        }
+
+    vector_channels_group = cast("h5py.Group | None", h5file.get("vector_channels"))
+    if vector_channels_group is not None:
+        plot_metadata = vector_channels_group.attrs.get("Plot window metadata", "[]")
+        data.plot_windows["vector_channels"] = json.loads(cast("str", plot_metadata))
+        data.vector_channels = {
+            channel_name: {
+                int(data_point): vector_dataset[:].tolist()
+                for data_point, vector_dataset in cast(
+                    "Sequence[tuple[str, h5py.Dataset]]", vector_group.items()
+                )
+                if start_index <= int(data_point) < stop_index
+            }
+            for channel_name, vector_group in cast(
+                "Sequence[tuple[str, h5py.Group]]",
+                vector_channels_group.items(),
+            )
+        }
 
-            sequence_json_dataset = cast(
-                "h5py.Dataset | tuple[()]", h5file.get("sequence_json", ())
+    data.fits = _read_fits_from_hdf5(h5file)
+
+
+def _read_data_point_columns(
+    h5file: h5py.File,
+    *,
+    start_index: int,
+    stop_index: int,
+) -> ColumnarExperimentData:
+    """Read the data points in `[start_index, stop_index)` as flat arrays."""
+    data = ColumnarExperimentData(
+        plot_windows={
+            "result_channels": [],
+            "shot_channels": [],
+            "vector_channels": [],
+        },
+        index=np.arange(start_index, stop_index, dtype=np.int64),
+        timestamps=np.empty(0, dtype="S26"),
+        scan_parameters={},
+        result_channels={},
+        shot_channels={},
+        vector_channels={},
+        json_sequences=_read_json_sequences(h5file),
+        realtime_scan=bool(h5file.attrs.get("realtime_scan", False)),
+        parameters=extract_parameter_values(h5file),
+        total_data_points=int(h5file.attrs.get("number_of_data_points", 0)),
+        fits=_read_fits_from_hdf5(h5file),
+    )
+
+    scan_parameters = cast("h5py.Dataset | None", h5file.get("scan_parameters"))
+    if scan_parameters is not None:
+        rows = cast("npt.NDArray[Any]", scan_parameters[start_index:stop_index, 0])
+        data.timestamps = rows["timestamp"]
+        data.scan_parameters = {
+            param: rows[param]
+            for param in cast("tuple[str, ...]", rows.dtype.names)
+            if param != "timestamp"
+        }
+
+    result_channel_dataset = h5file.get("result_channels")
+    if result_channel_dataset is not None:
+        plot_metadata = result_channel_dataset.attrs.get("Plot window metadata")
+        if plot_metadata:
+            data.plot_windows["result_channels"] = json.loads(
+                cast("str", plot_metadata)
             )
-            data.json_sequences = [
-                [
-                    cast("np.int32", entry["index"]).item(),
-                    entry["Sequence"].decode(),
-                ]
-                for entry in sequence_json_dataset
-            ]
-            data.parameters = extract_parameter_values(h5file)
-            data.fits = _read_fits_from_hdf5(h5file)
-        return data
+        rows = cast("npt.NDArray[Any]", result_channel_dataset[start_index:stop_index])
+        data.result_channels = {
+            channel_name: rows[channel_name]
+            for channel_name in cast("tuple[str, ...]", rows.dtype.names)
+        }
+
+    shot_channels_group = cast("h5py.Group | None", h5file.get("shot_channels"))
+    if shot_channels_group is not None:
+        plot_metadata = shot_channels_group.attrs.get("Plot window metadata")
+        if plot_metadata:
+            data.plot_windows["shot_channels"] = json.loads(cast("str", plot_metadata))
+        data.shot_channels = {
+            key: read_shot_dataset(dataset, start_index, stop_index)
+            for key, dataset in cast(
+                "Sequence[tuple[str, h5py.Dataset]]", shot_channels_group.items()
+            )
+        }
+
+    vector_channels_group = cast("h5py.Group | None", h5file.get("vector_channels"))
+    if vector_channels_group is not None:
+        plot_metadata = vector_channels_group.attrs.get("Plot window metadata", "[]")
+        data.plot_windows["vector_channels"] = json.loads(cast("str", plot_metadata))
+        data.vector_channels = {
+            channel_name: _read_vector_channel_columns(
+                vector_group, start_index=start_index, stop_index=stop_index
+            )
+            for channel_name, vector_group in cast(
+                "Sequence[tuple[str, h5py.Group]]", vector_channels_group.items()
+            )
+        }
+
+    return data
+
+
+def _read_shot_statistics(
+    h5file: h5py.File, *, start_index: int, stop_index: int
+) -> dict[str, ShotStatistics]:
+    """Read (or compute) the shot statistics of the data points in range."""
+    shot_channels_group = cast("h5py.Group", h5file.get("shot_channels", {}))
+    statistics_group = cast("h5py.Group", h5file.get("shot_statistics", {}))
+    config = get_config().data.shot_statistics
+
+    statistics: dict[str, ShotStatistics] = {}
+    for key, dataset in cast(
+        "Sequence[tuple[str, h5py.Dataset]]", shot_channels_group.items()
+    ):
+        channel_group = cast("h5py.Group | None", statistics_group.get(key))
+        if channel_group is None:
+            statistics[key] = compute_shot_statistics(
+                read_shot_dataset(dataset, start_index, stop_index),
+                histogram_bins=config.histogram_bins,
+                thresholds=config.channel_thresholds.get(key, config.thresholds),
+            )
+            continue
+        _, thresholds = _get_shot_statistics_parameters(channel_group)
+        statistics[key] = ShotStatistics(
+            **{
+                name: channel_group[name][start_index:stop_index]
+                for name in _SHOT_STATISTICS_FIELDS
+            },
+            thresholds=np.asarray(thresholds, dtype=np.float64),
+        )
+    return statistics
+
+
+def _read_vector_channel_columns(
+    vector_group: h5py.Group, *, start_index: int, stop_index: int
+) -> VectorChannelColumns:
+    indices = sorted(
+        index for index in map(int, vector_group) if start_index <= index < stop_index
+    )
+    vectors = [
+        cast("npt.NDArray[np.float64]", vector_group[str(index)][:])
+        for index in indices
+    ]
+    lengths = [len(vector) for vector in vectors]
+    return VectorChannelColumns(
+        index=np.array(indices, dtype=np.int64),
+        offsets=np.concatenate(([0], np.cumsum(lengths, dtype=np.int64))),
+        values=(
+            np.concatenate(vectors).astype(np.float64)
+            if vectors
+            else np.empty(0, dtype=np.float64)
+        ),
+    )
+
+
+def _read_json_sequences(
+    h5file: h5py.File,
+    start_index: int = 0,
+    stop_index: int | None = None,
+) -> list[list[int | str]]:
+    """Return the `[index, sequence_json]` entries recorded within an index range."""
+    sequence_json_dataset = cast(
+        "h5py.Dataset | tuple[()]", h5file.get("sequence_json", ())
+    )
+    sequences: list[list[int | str]] = []
+    for entry in sequence_json_dataset:
+        index = cast("np.int32", entry["index"]).item()
+        if index >= start_index and (stop_index is None or index < stop_index):
+            sequences.append([index, entry["Sequence"].decode()])
+    return sequences
+
+
+def _get_data_point_timestamp(h5file: h5py.File, index: int) -> str | None:
+    """Return the acquisition timestamp of a data point, or None if it is not stored."""
+    scan_parameters = cast("h5py.Dataset | None", h5file.get("scan_parameters"))
+    if index < 0 or scan_parameters is None or index >= scan_parameters.shape[0]:
+        return None
+    return cast("bytes", scan_parameters[index, 0]["timestamp"]).decode()
 
 
 def extract_parameter_values(
     h5file: h5py.File,
+    since: str | None = None,
+) -> dict[str, ParameterValue]:
+    """Return the last stored value of each parameter.
+
+    Reads the parameter history table in one pass. Files written before the table
+    was introduced are read from their per-parameter datasets.
+
+    Args:
+        h5file: Open HDF5 file handle.
+        since: Optional timestamp. If given, only parameters whose last update is
+            more recent than this timestamp are returned.
+    """
+    names_dataset = cast("h5py.Dataset | None", h5file.get(PARAMETER_NAMES_DATASET))
+    history = cast("h5py.Dataset | None", h5file.get(PARAMETER_HISTORY_DATASET))
+    if names_dataset is None or history is None:
+        return _extract_legacy_parameter_values(h5file, since=since)
+
+    rows, last_rows = _last_parameter_rows(history)
+    if since is not None:
+        last_rows = last_rows[rows["timestamp"][last_rows] > since.encode()]
+    names = _read_parameter_names(names_dataset)
+    values = _decode_parameter_values(history, rows, last_rows)
+    return {
+        names[parameter]: ParameterValue(timestamp=timestamp.decode(), value=value)
+        for parameter, timestamp, value in zip(
+            rows["parameter"][last_rows].tolist(),
+            rows["timestamp"][last_rows].tolist(),
+            values,
+            strict=True,
+        )
+    }
+
+
+def _extract_legacy_parameter_values(
+    h5file: h5py.File,
+    since: str | None = None,
 ) -> dict[str, ParameterValue]:
+    """Return the last value of each parameter stored under the 'parameters' group."""
+
     def last_value(d: h5py.Dataset) -> ParameterValue:
         ts, val = d[-1].tolist()
         if isinstance(val, bytes):
@@ -779,28 +1691,14 @@ def extract_parameter_values(
 
     def visitor(name: str, obj: h5py.HLObject) -> None:
         if isinstance(obj, h5py.Dataset):
-            result[name] = last_value(obj)
+            value = last_value(obj)
+            if since is None or value.timestamp > since:
+                result[name] = value
 
     parameters_group.visititems(visitor)
     return result
 
 
-def get_hdf5_dtype(
-    value: str | float | bool,  # noqa: FBT001
-) -> type[np.float64 | np.bool | np.int64] | h5py.Datatype:
-    """Return the HDF5-compatible dtype."""
-    if isinstance(value, str):
-        return h5py.string_dtype()
-    if isinstance(value, bool):
-        return np.bool
-    if isinstance(value, int):
-        return np.int64
-    if isinstance(value, float):
-        return np.float64
-
-    raise TypeError(f"Unsupported parameter type: {type(value)}")
-
-
 def get_result_channels_dataset(
     h5file: h5py.File, result_channels: list[str], number_of_data_points: int = 1
 ) -> h5py.Dataset:
@@ -823,12 +1721,63 @@ POLL_INTERVAL = 0.05
 _HDF5_GLOBAL_LOCK = threading.RLock()
 
 
+def start_swmr_write(h5file: h5py.File) -> None:
+    """Switch a file opened for writing into SWMR (single-writer/multiple-reader) mode.
+
+    Once in SWMR mode, the writer releases its file lock and readers in other
+    processes can attach with `swmr=True` while data is being appended. Files created
+    before ICON wrote SWMR-capable files (superblock version < 3) are left in regular
+    write mode.
+
+    Args:
+        h5file: HDF5 file handle opened with `libver="latest"` in a write mode.
+    """
+    if h5file.swmr_mode:
+        return
+    try:
+        h5file.swmr_mode = True
+    except RuntimeError:
+        logger.debug(
+            "File %s does not support SWMR, writing without it", h5file.filename
+        )
+
+
 @contextmanager
-def h5_open(path: Path, mode: str, **kwargs: Any) -> Iterator[h5py.File]:
-    with _HDF5_GLOBAL_LOCK:
+def h5_open(
+    path: Path, mode: str, *, swmr_write: bool = True, **kwargs: Any
+) -> Iterator[h5py.File]:
+    """Open an HDF5 file, retrying until it becomes available.
+
+    Writers create files with the latest file format and switch them to SWMR mode
+    right after opening (see [start_swmr_write][..start_swmr_write]). They are
+    serialised within a process by a global lock and across processes by HDF5's
+    file locks and consistency flags.
+
+    Readers attach with `swmr=True` and without taking file locks, so they neither
+    block nor are blocked by the writer. A reader opening the file while a writer is
+    between opening it and switching to SWMR mode simply retries.
+
+    Args:
+        path: Path of the HDF5 file.
+        mode: h5py file mode (`"r"`, `"r+"`, `"a"`, `"w"`, ...).
+        swmr_write: Switch writers to SWMR mode. Disable for structural changes
+            such as deleting objects, which SWMR mode does not support.
+        **kwargs: Additional keyword arguments passed to `h5py.File`.
+    """
+    lock: AbstractContextManager[Any]
+    if mode == "r":
+        kwargs = {"swmr": True, "locking": False, **kwargs}
+        lock = nullcontext()
+    else:
+        kwargs = {"libver": "latest", **kwargs}
+        lock = _HDF5_GLOBAL_LOCK
+
+    with lock:
         while True:
             try:
                 with h5py.File(str(path), mode, **kwargs) as h5file:
+                    if mode != "r" and swmr_write:
+                        start_swmr_write(h5file)
                     yield h5file
                 break
             except (OSError, FileNotFoundError):
@@ -866,7 +1815,8 @@ def write_fit_result_by_job_id(
     """
     filename = get_filename_by_job_id(job_id)
     h5_path = Path(get_config().data.results_dir) / filename
-    with h5_open(h5_path, "a") as h5file:
+    # replacing a fit deletes objects, which is not supported in SWMR mode
+    with h5_open(h5_path, "a", swmr_write=False) as h5file:
         fits_group = h5file.require_group("fits")
         channel = fit_result.result_channel
         if channel in fits_group:
@@ -902,6 +1852,6 @@ def delete_fit_result_by_job_id(*, job_id: int, result_channel: str) -> None:
     """
     filename = get_filename_by_job_id(job_id)
     h5_path = Path(get_config().data.results_dir) / filename
-    with h5_open(h5_path, "a") as h5file:
+    with h5_open(h5_path, "a", swmr_write=False) as h5file:
         if "fits" in h5file and result_channel in h5file["fits"]:
             del h5file["fits"][result_channel]
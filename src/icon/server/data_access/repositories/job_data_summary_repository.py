@@ -0,0 +1,340 @@
+import logging
+from collections.abc import Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any, TypedDict, cast
+
+import h5py  # type: ignore
+import sqlalchemy.orm
+from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert
+
+from icon.config.config import get_config
+from icon.server.data_access.db_context.sqlite import engine
+from icon.server.data_access.models.enums import JobStatus
+from icon.server.data_access.models.sqlite.job import Job
+from icon.server.data_access.models.sqlite.job_data_summary import JobDataSummary
+from icon.server.data_access.repositories.experiment_data_repository import (
+    ExperimentDataPoint,
+    get_filename_by_job_id,
+    h5_open,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class JobFileSummary(TypedDict):
+    """Facts about a job read from its HDF5 file."""
+
+    job_id: int | None
+    """Job identifier stored in the file, if any."""
+    number_of_data_points: int
+    result_channels: list[str]
+    shot_channels: list[str]
+    vector_channels: list[str]
+    realtime_scan: bool
+    last_timestamp: str | None
+    fitted_channels: list[str]
+
+
+def read_job_file_summary(h5file: h5py.File) -> JobFileSummary:
+    """Collect the facts stored in the job data summary from an open HDF5 file."""
+    total = int(h5file.attrs.get("number_of_data_points", 0))
+    result_channels = cast("h5py.Dataset | None", h5file.get("result_channels"))
+    scan_parameters = cast("h5py.Dataset | None", h5file.get("scan_parameters"))
+
+    last_timestamp = None
+    if scan_parameters is not None and 0 < total <= scan_parameters.shape[0]:
+        last_timestamp = scan_parameters[total - 1, 0]["timestamp"].decode()
+
+    job_id = h5file.attrs.get("job_id")
+    return {
+        "job_id": int(job_id) if job_id is not None else None,
+        "number_of_data_points": total,
+        "result_channels": list(
+            result_channels.dtype.names or () if result_channels is not None else ()
+        ),
+        "shot_channels": list(h5file.get("shot_channels", {})),
+        "vector_channels": list(h5file.get("vector_channels", {})),
+        "realtime_scan": bool(h5file.attrs.get("realtime_scan", False)),
+        "last_timestamp": last_timestamp,
+        "fitted_channels": list(h5file.get("fits", {})),
+    }
+
+
+def _get_file_size(job_id: int) -> int:
+    h5_path = Path(get_config().data.results_dir) / get_filename_by_job_id(job_id)
+    try:
+        return h5_path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+class JobDataSummaryRepository:
+    """Repository for `JobDataSummary` entities.
+
+    Keeps per-job facts about the stored experiment data in SQLite so that listings
+    and lookups can be answered without opening HDF5 files.
+    """
+
+    @staticmethod
+    def _upsert(*, job_id: int, values: dict[str, Any]) -> None:
+        stmt = insert(JobDataSummary).values(job_id=job_id, **values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobDataSummary.job_id], set_=values
+        )
+        with sqlalchemy.orm.Session(engine) as session:
+            session.execute(stmt)
+            session.commit()
+
+    @staticmethod
+    def update_data_point(
+        *,
+        job_id: int,
+        experiment_source_id: int,
+        data_point: ExperimentDataPoint,
+        realtime_scan: bool,
+    ) -> None:
+        """Update the summary of a job after a data point was written.
+
+        Args:
+            job_id: Job identifier.
+            experiment_source_id: Experiment source of the job.
+            data_point: The data point that was written.
+            realtime_scan: Whether the job scans a realtime parameter.
+        """
+        summary = JobDataSummaryRepository.get_summary_by_job_id(job_id=job_id)
+        number_of_data_points = data_point.index + 1
+        last_timestamp: str | None = data_point.timestamp
+        if summary is not None and summary.number_of_data_points > data_point.index:
+            number_of_data_points = summary.number_of_data_points
+            last_timestamp = summary.last_timestamp
+
+        JobDataSummaryRepository._upsert(
+            job_id=job_id,
+            values={
+                "experiment_source_id": experiment_source_id,
+                "number_of_data_points": number_of_data_points,
+                "result_channels": list(data_point.result_channels),
+                "shot_channels": list(data_point.shot_channels),
+                "vector_channels": list(data_point.vector_channels),
+                "realtime_scan": realtime_scan,
+                "last_timestamp": last_timestamp,
+                "file_size": _get_file_size(job_id),
+            },
+        )
+
+    @staticmethod
+    def update_fitted_channel(
+        *, job_id: int, result_channel: str, has_fit: bool
+    ) -> None:
+        """Record that a fit of a result channel was stored or deleted.
+
+        Jobs without a summary yet are left alone; they are picked up by the
+        backfill.
+
+        Args:
+            job_id: Job identifier.
+            result_channel: Name of the fitted result channel.
+            has_fit: True if the fit was stored, False if it was deleted.
+        """
+        with sqlalchemy.orm.Session(engine) as session:
+            summary = session.get(JobDataSummary, job_id)
+            if summary is None:
+                return
+            fitted_channels = [
+                channel
+                for channel in summary.fitted_channels
+                if channel != result_channel
+            ]
+            if has_fit:
+                fitted_channels.append(result_channel)
+            session.execute(
+                update(JobDataSummary)
+                .where(JobDataSummary.job_id == job_id)
+                .values(
+                    fitted_channels=fitted_channels,
+                    has_fit=bool(fitted_channels),
+                    file_size=_get_file_size(job_id),
+                )
+            )
+            session.commit()
+
+    @staticmethod
+    def update_from_file(*, h5_path: Path) -> int | None:
+        """Create or refresh the summary of a job from its HDF5 file.
+
+        Args:
+            h5_path: Path of the job's HDF5 file.
+
+        Returns:
+            The job ID, or None if the file does not belong to a known job.
+        """
+        with h5_open(h5_path, "r") as h5file:
+            file_summary = read_job_file_summary(h5file)
+
+        job_id = file_summary["job_id"]
+        if job_id is None:
+            return None
+
+        with sqlalchemy.orm.Session(engine) as session:
+            experiment_source_id = session.execute(
+                select(Job.experiment_source_id).where(Job.id == job_id)
+            ).scalar_one_or_none()
+        if experiment_source_id is None:
+            return None
+
+        JobDataSummaryRepository._upsert(
+            job_id=job_id,
+            values={
+                **{
+                    key: value for key, value in file_summary.items() if key != "job_id"
+                },
+                "experiment_source_id": experiment_source_id,
+                "has_fit": bool(file_summary["fitted_channels"]),
+                "file_size": h5_path.stat().st_size,
+            },
+        )
+        return job_id
+
+    @staticmethod
+    def backfill(*, results_dir: Path | None = None) -> int:
+        """Populate the summary table from all HDF5 files of a results directory.
+
+        Args:
+            results_dir: Directory to scan. Defaults to the configured results
+                directory.
+
+        Returns:
+            Number of jobs whose summary was written.
+        """
+        if results_dir is None:
+            results_dir = Path(get_config().data.results_dir)
+
+        count = 0
+        for h5_path in sorted(results_dir.glob("*.h5")):
+            try:
+                job_id = JobDataSummaryRepository.update_from_file(h5_path=h5_path)
+            except OSError:
+                logger.exception("Could not summarise %s", h5_path)
+                continue
+            if job_id is None:
+                logger.warning("Skipping %s: not linked to a known job", h5_path)
+                continue
+            count += 1
+        logger.info("Backfilled job data summary of %d jobs", count)
+        return count
+
+    @staticmethod
+    def get_summary_by_job_id(*, job_id: int) -> JobDataSummary | None:
+        """Fetch the summary of a job.
+
+        Args:
+            job_id: Job identifier.
+
+        Returns:
+            The summary, or None if the job has none.
+        """
+        with sqlalchemy.orm.Session(engine) as session:
+            return session.get(JobDataSummary, job_id)
+
+    @staticmethod
+    def get_summaries(
+        *,
+        job_ids: Sequence[int] | None = None,
+        experiment_source_id: int | None = None,
+    ) -> Sequence[JobDataSummary]:
+        """List job summaries, optionally filtered.
+
+        Args:
+            job_ids: Optional job identifiers to restrict to.
+            experiment_source_id: Optional experiment source filter.
+
+        Returns:
+            Matching summaries ordered by job ID.
+        """
+        with sqlalchemy.orm.Session(engine) as session:
+            stmt = select(JobDataSummary).order_by(JobDataSummary.job_id.asc())
+            if job_ids is not None:
+                stmt = stmt.where(JobDataSummary.job_id.in_(job_ids))
+            if experiment_source_id is not None:
+                stmt = stmt.where(
+                    JobDataSummary.experiment_source_id == experiment_source_id
+                )
+            return session.execute(stmt).scalars().all()
+
+    @staticmethod
+    def get_latest_job_id_with_fit(
+        *, experiment_source_id: int, exclude_job_id: int | None = None
+    ) -> int | None:
+        """Return the most recent processed job of an experiment source with a fit.
+
+        Args:
+            experiment_source_id: Experiment source to search.
+            exclude_job_id: Optional job to ignore (e.g. the job being fitted).
+
+        Returns:
+            The job ID, or None if no such job exists.
+        """
+        with sqlalchemy.orm.Session(engine) as session:
+            stmt = (
+                select(JobDataSummary.job_id)
+                .join(Job, Job.id == JobDataSummary.job_id)
+                .where(
+                    JobDataSummary.experiment_source_id == experiment_source_id,
+                    JobDataSummary.has_fit.is_(True),
+                    Job.status == JobStatus.PROCESSED,
+                )
+                .order_by(JobDataSummary.job_id.desc())
+                .limit(1)
+            )
+            if exclude_job_id is not None:
+                stmt = stmt.where(JobDataSummary.job_id != exclude_job_id)
+            return session.execute(stmt).scalar_one_or_none()
+
+    @staticmethod
+    def get_job_ids_to_compact(
+        *, updated_before: datetime, limit: int = 10
+    ) -> Sequence[int]:
+        """Return processed jobs whose files have not been compacted yet.
+
+        Args:
+            updated_before: Only return jobs whose summary was last updated before
+                this time, i.e. whose files are no longer being written.
+            limit: Maximum number of returned jobs.
+
+        Returns:
+            Job IDs, oldest first.
+        """
+        with sqlalchemy.orm.Session(engine) as session:
+            stmt = (
+                select(JobDataSummary.job_id)
+                .join(Job, Job.id == JobDataSummary.job_id)
+                .where(
+                    JobDataSummary.compacted.is_(False),
+                    JobDataSummary.updated < updated_before,
+                    Job.status == JobStatus.PROCESSED,
+                )
+                .order_by(JobDataSummary.job_id.asc())
+                .limit(limit)
+            )
+            return session.execute(stmt).scalars().all()
+
+    @staticmethod
+    def mark_compacted(*, job_id: int, file_size: int | None = None) -> None:
+        """Record that the file of a job was compacted or should not be compacted.
+
+        Args:
+            job_id: Job identifier.
+            file_size: Size of the compacted file in bytes. Left unchanged if None.
+        """
+        values: dict[str, Any] = {"compacted": True}
+        if file_size is not None:
+            values["file_size"] = file_size
+        with sqlalchemy.orm.Session(engine) as session:
+            session.execute(
+                update(JobDataSummary)
+                .where(JobDataSummary.job_id == job_id)
+                .values(**values)
+            )
+            session.commit()
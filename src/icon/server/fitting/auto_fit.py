@@ -8,14 +8,15 @@ from typing import Any
 
 import numpy as np
 
-from icon.server.data_access.models.enums import JobStatus
 from icon.server.data_access.repositories.experiment_data_repository import (
     ExperimentData,
     ExperimentDataRepository,
     get_fit_results_by_job_id,
     write_fit_result_by_job_id,
 )
-from icon.server.data_access.repositories.job_repository import JobRepository
+from icon.server.data_access.repositories.job_data_summary_repository import (
+    JobDataSummaryRepository,
+)
 from icon.server.fitting.fit_runner import run_curve_fit
 from icon.server.web_server.socketio_emit_queue import emit_queue
 
@@ -91,6 +92,9 @@ def _fit_channel(
 
     if fit_result.success:
         write_fit_result_by_job_id(job_id=job_id, fit_result=fit_result)
+        JobDataSummaryRepository.update_fitted_channel(
+            job_id=job_id, result_channel=channel_name, has_fit=True
+        )
         emit_queue.put(
             {
                 "event": f"experiment_fit_{job_id}",
@@ -113,30 +117,15 @@ def _fit_channel(
         )
 
 
-_MAX_PREVIOUS_JOBS_TO_CHECK = 10
-
-
 def _find_previous_job_with_fit(
     experiment_source_id: int,
     exclude_job_id: int,
 ) -> int | None:
     """Find the most recent PROCESSED job with a stored fit.
 
-    Only checks the last few jobs to avoid scanning the entire history.
+    Answered from the job data summary index without opening any HDF5 file.
     """
-    rows = JobRepository.get_job_by_experiment_source_and_status(
+    return JobDataSummaryRepository.get_latest_job_id_with_fit(
         experiment_source_id=experiment_source_id,
-        status=JobStatus.PROCESSED,
+        exclude_job_id=exclude_job_id,
     )
-    # Rows are ordered by (priority asc, created asc), so iterate in reverse
-    checked = 0
-    for (job,) in reversed(rows):
-        if job.id == exclude_job_id:
-            continue
-        fits = get_fit_results_by_job_id(job_id=job.id)
-        if fits:
-            return job.id
-        checked += 1
-        if checked >= _MAX_PREVIOUS_JOBS_TO_CHECK:
-            break
-    return None
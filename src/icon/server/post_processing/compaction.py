@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import h5py  # type: ignore
+
+from icon.config.config import get_config
+from icon.server.data_access.models.enums import JobStatus
+from icon.server.data_access.repositories.experiment_data_repository import (
+    get_filename_by_job_id,
+)
+from icon.server.data_access.repositories.job_data_summary_repository import (
+    JobDataSummaryRepository,
+)
+from icon.server.data_access.repositories.job_repository import JobRepository
+from icon.server.utils.handle_keyboard_interrupt import handle_keyboard_interrupt
+
+if TYPE_CHECKING:
+    import queue
+    from collections.abc import Callable
+
+    from icon.config.latest import CompactionConfig
+    from icon.server.hardware_processing.task import HardwareProcessingTask
+
+logger = logging.getLogger(__name__)
+
+TARGET_CHUNK_BYTES = 1 << 20
+"""Approximate size of the chunks of compacted datasets."""
+COPY_BLOCK_BYTES = 4 << 20
+"""Approximate amount of data copied between I/O budget and abort checks."""
+
+
+class CompactionAbortedError(Exception):
+    """Raised when a compaction is interrupted, e.g. because a job started."""
+
+
+class IOBudget:
+    """Throttle I/O to a maximum average number of bytes per second."""
+
+    def __init__(self, bytes_per_second: int) -> None:
+        self._bytes_per_second = bytes_per_second
+        self._available_at = time.monotonic()
+
+    def consume(self, number_of_bytes: int) -> None:
+        """Account for *number_of_bytes* of I/O, sleeping if over budget."""
+        if self._bytes_per_second <= 0:
+            return
+        now = time.monotonic()
+        self._available_at = (
+            max(self._available_at, now) + number_of_bytes / self._bytes_per_second
+        )
+        delay = self._available_at - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _chunk_shape(dataset: h5py.Dataset) -> tuple[int, ...]:
+    row_bytes = dataset.dtype.itemsize * math.prod(dataset.shape[1:])
+    rows = max(1, min(dataset.shape[0], TARGET_CHUNK_BYTES // max(row_bytes, 1)))
+    return (rows, *dataset.shape[1:])
+
+
+def _copy_attributes(source: h5py.HLObject, target: h5py.HLObject) -> None:
+    for name in source.attrs:
+        target.attrs.create(
+            name, source.attrs[name], dtype=source.attrs.get_id(name).dtype
+        )
+
+
+def _copy_dataset(
+    source: h5py.Dataset,
+    target_group: h5py.Group,
+    name: str,
+    *,
+    compression: str | None,
+    compression_opts: int | None,
+    io_budget: IOBudget | None,
+    should_continue: Callable[[], bool],
+) -> None:
+    if source.shape == () or source.shape is None:
+        target_group.create_dataset(name, data=source[()], dtype=source.dtype)
+        _copy_attributes(source, target_group[name])
+        return
+
+    empty = source.shape[0] == 0 or math.prod(source.shape[1:]) == 0
+    target = target_group.create_dataset(
+        name,
+        shape=source.shape,
+        maxshape=source.maxshape,
+        dtype=source.dtype,
+        chunks=True if empty else _chunk_shape(source),
+        compression=compression,
+        compression_opts=compression_opts if compression == "gzip" else None,
+    )
+    _copy_attributes(source, target)
+    if empty:
+        return
+
+    row_bytes = source.dtype.itemsize * math.prod(source.shape[1:])
+    rows_per_block = max(1, COPY_BLOCK_BYTES // max(row_bytes, 1))
+    for start in range(0, source.shape[0], rows_per_block):
+        if not should_continue():
+            raise CompactionAbortedError
+        stop = min(start + rows_per_block, source.shape[0])
+        target[start:stop] = source[start:stop]
+        if io_budget is not None:
+            # read and write
+            io_budget.consume(2 * (stop - start) * row_bytes)
+
+
+def _copy_group(
+    source: h5py.Group,
+    target: h5py.Group,
+    **kwargs: Any,
+) -> None:
+    _copy_attributes(source, target)
+    for name, obj in source.items():
+        if isinstance(obj, h5py.Group):
+            _copy_group(obj, target.create_group(name), **kwargs)
+        else:
+            _copy_dataset(obj, target, name, **kwargs)
+
+
+def compact_job_file(
+    h5_path: Path,
+    *,
+    compression: str | None = "gzip",
+    compression_opts: int | None = 4,
+    io_budget: IOBudget | None = None,
+    should_continue: Callable[[], bool] = lambda: True,
+) -> int | None:
+    """Rewrite a job file with final-size chunks and compression.
+
+    Files written point by point consist of many small chunks grown one row at a
+    time. The file is copied into a temporary file next to it, with chunk sizes based
+    on the final dataset shapes, and atomically swapped in. Readers that still have
+    the old file open keep reading it.
+
+    Args:
+        h5_path: Path of the job's HDF5 file.
+        compression: Compression filter of the compacted datasets.
+        compression_opts: Compression level (gzip only).
+        io_budget: Optional throttle for the copied bytes.
+        should_continue: Called between copied blocks; the compaction is aborted if
+            it returns False.
+
+    Returns:
+        The size of the compacted file, or None if the file was modified during the
+        compaction and was left unchanged.
+
+    Raises:
+        CompactionAbortedError: If *should_continue* returned False.
+    """
+    stat_before = h5_path.stat()
+    tmp_path = h5_path.with_name(h5_path.name + ".compacting")
+    try:
+        with (
+            # unlike h5_open, don't retry forever on unreadable files
+            h5py.File(h5_path, "r", swmr=True, locking=False) as source,
+            h5py.File(tmp_path, "w", libver="latest") as target,
+        ):
+            _copy_group(
+                source,
+                target,
+                compression=compression,
+                compression_opts=compression_opts,
+                io_budget=io_budget,
+                should_continue=should_continue,
+            )
+        with tmp_path.open("rb") as tmp_file:
+            os.fsync(tmp_file.fileno())
+
+        stat_after = h5_path.stat()
+        if (stat_after.st_mtime_ns, stat_after.st_size) != (
+            stat_before.st_mtime_ns,
+            stat_before.st_size,
+        ):
+            logger.info("%s changed during compaction, keeping it", h5_path)
+            return None
+        tmp_path.replace(h5_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+    size = h5_path.stat().st_size
+    logger.info("Compacted %s from %d to %d bytes", h5_path, stat_before.st_size, size)
+    return size
+
+
+def compact_job(
+    job_id: int,
+    *,
+    config: CompactionConfig,
+    should_continue: Callable[[], bool] = lambda: True,
+) -> bool:
+    """Compact the file of a finished job and update its summary.
+
+    Args:
+        job_id: Job identifier.
+        config: Compaction settings.
+        should_continue: Called between copied blocks; the compaction is aborted if
+            it returns False.
+
+    Returns:
+        True if the job needs no further compaction.
+    """
+    h5_path = Path(get_config().data.results_dir) / get_filename_by_job_id(job_id)
+    if not h5_path.exists():
+        logger.warning("Not compacting job %d: %s does not exist", job_id, h5_path)
+        JobDataSummaryRepository.mark_compacted(job_id=job_id, file_size=0)
+        return True
+
+    try:
+        size = compact_job_file(
+            h5_path,
+            compression=config.compression,
+            compression_opts=config.compression_opts,
+            io_budget=IOBudget(config.io_bytes_per_second),
+            should_continue=should_continue,
+        )
+    except CompactionAbortedError:
+        logger.debug("Compaction of job %d aborted", job_id)
+        return False
+    if size is None:
+        return False
+    JobDataSummaryRepository.mark_compacted(job_id=job_id, file_size=size)
+    return True
+
+
+class CompactionWorker(multiprocessing.Process):
+    """Rewrites the files of finished jobs while no experiment is running.
+
+    Compacts files (see [compact_job_file][..compact_job_file]) of jobs that are
+    processed and whose summary has not changed for
+    `data.compaction.min_job_age_seconds`. Work only starts, and is aborted, while
+    the hardware queue is empty and no job is being processed, and the copied bytes
+    are throttled to `data.compaction.io_bytes_per_second`.
+    """
+
+    def __init__(
+        self,
+        hardware_processing_queue: queue.PriorityQueue[HardwareProcessingTask],
+    ) -> None:
+        super().__init__()
+        self._hardware_processing_queue = hardware_processing_queue
+
+        self._last_idle_check = 0.0
+        self._was_idle = False
+
+    def _idle(self) -> bool:
+        idle = self._hardware_processing_queue.empty() and not (
+            JobRepository.get_jobs_by_status_and_timeframe(status=JobStatus.PROCESSING)
+        )
+        self._last_idle_check, self._was_idle = time.monotonic(), idle
+        return idle
+
+    def _should_continue(self) -> bool:
+        # the hardware queue is cheap to query, the database less so
+        if not self._hardware_processing_queue.empty():
+            return False
+        if time.monotonic() - self._last_idle_check > 1.0:
+            return self._idle()
+        return self._was_idle
+
+    def _compact_pending_jobs(self, config: CompactionConfig) -> None:
+        job_ids = JobDataSummaryRepository.get_job_ids_to_compact(
+            updated_before=datetime.now(UTC)
+            - timedelta(seconds=config.min_job_age_seconds),
+        )
+        for job_id in job_ids:
+            try:
+                if not compact_job(
+                    job_id, config=config, should_continue=self._should_continue
+                ):
+                    return
+            except Exception:
+                logger.exception("Failed to compact job %d, skipping it", job_id)
+                JobDataSummaryRepository.mark_compacted(job_id=job_id)
+
+    @handle_keyboard_interrupt(logger)
+    def run(self) -> None:
+        logger.info("Compaction worker started")
+
+        while True:
+            time.sleep(get_config().data.compaction.poll_interval_seconds)
+            config = get_config().data.compaction
+            if config.enabled and self._idle():
+                self._compact_pending_jobs(config)
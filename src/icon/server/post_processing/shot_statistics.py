@@ -0,0 +1,68 @@
+"""Per-data-point statistics of shot channels.
+
+Shot channels hold one value (photon count or bit) per shot. Plots mostly need
+aggregates per data point, which are computed here for many data points at once.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass
+class ShotStatistics:
+    """Aggregates of a shot channel for a range of data points.
+
+    All arrays have the data points along the first axis.
+    """
+
+    histogram: npt.NDArray[np.uint32]
+    """Histogram of the shot values (data points x bins). Bin `k` counts values
+    rounding to `k`; values beyond the last bin are counted in the last bin."""
+    mean: npt.NDArray[np.float64]
+    """Mean of the shot values."""
+    variance: npt.NDArray[np.float64]
+    """Variance of the shot values (the standard error of the mean is
+    `sqrt(variance / number_of_shots)`)."""
+    thresholds: npt.NDArray[np.float64]
+    """Thresholds used for `populations`."""
+    populations: npt.NDArray[np.float64]
+    """Fraction of shots above each threshold (data points x thresholds)."""
+
+
+def compute_shot_statistics(
+    shots: npt.NDArray[Any], *, histogram_bins: int, thresholds: list[float]
+) -> ShotStatistics:
+    """Compute shot statistics for many data points at once.
+
+    Args:
+        shots: Shot values of shape (data points, shots).
+        histogram_bins: Number of unit-width histogram bins, starting at 0.
+        thresholds: Thresholds for the populations.
+
+    Returns:
+        The statistics of each data point.
+    """
+    shots = np.asarray(shots, dtype=np.float64)
+    points = shots.shape[0]
+
+    bins = np.clip(np.floor(shots + 0.5), 0, histogram_bins - 1).astype(np.int64)
+    offsets = np.arange(points, dtype=np.int64)[:, np.newaxis] * histogram_bins
+    histogram = np.bincount(
+        (bins + offsets).ravel(), minlength=points * histogram_bins
+    ).reshape(points, histogram_bins)
+
+    threshold_array = np.asarray(thresholds, dtype=np.float64)
+    populations = (shots[:, :, np.newaxis] > threshold_array).mean(axis=1)
+
+    return ShotStatistics(
+        histogram=histogram.astype(np.uint32),
+        mean=shots.mean(axis=1),
+        variance=shots.var(axis=1),
+        thresholds=threshold_array,
+        populations=populations.reshape(points, len(threshold_array)),
+    )
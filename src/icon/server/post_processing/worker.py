@@ -4,9 +4,15 @@ import logging
 import multiprocessing
 from typing import TYPE_CHECKING
 
+from icon.server.data_access.models.sqlite.scan_parameter import (
+    contains_realtime_parameter,
+)
 from icon.server.data_access.repositories.experiment_data_repository import (
     ExperimentDataRepository,
 )
+from icon.server.data_access.repositories.job_data_summary_repository import (
+    JobDataSummaryRepository,
+)
 from icon.server.data_access.repositories.job_run_repository import (
     job_run_cancelled_or_failed,
 )
@@ -42,3 +48,11 @@ class PostProcessingWorker(multiprocessing.Process):
                 job_id=task.pre_processing_task.job.id,
                 data_point=task.data_point,
             )
+            JobDataSummaryRepository.update_data_point(
+                job_id=task.pre_processing_task.job.id,
+                experiment_source_id=task.pre_processing_task.job.experiment_source_id,
+                data_point=task.data_point,
+                realtime_scan=contains_realtime_parameter(
+                    task.pre_processing_task.scan_parameters
+                ),
+            )
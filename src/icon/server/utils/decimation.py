@@ -0,0 +1,107 @@
+"""Downsampling of large data series for plotting.
+
+Both algorithms return the *indices* of the points to keep, so that the caller can
+apply the selection to any aligned arrays (data point index, scan values, ...).
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+
+DecimationMethod = Literal["lttb", "minmax"]
+"""Supported decimation algorithms."""
+
+_MIN_LTTB_POINTS = 3
+
+
+def lttb(
+    x: npt.NDArray[np.float64], y: npt.NDArray[np.float64], n_out: int
+) -> npt.NDArray[np.int64]:
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last point and, for each of the `n_out - 2` buckets in
+    between, the point forming the largest triangle with the previously selected
+    point and the average of the next bucket. This preserves the visual shape of the
+    curve well.
+
+    Args:
+        x: Monotonically increasing x values.
+        y: Y values aligned with `x`.
+        n_out: Number of points to keep.
+
+    Returns:
+        Sorted indices of the selected points.
+    """
+    n = len(x)
+    if n_out >= n or n_out < _MIN_LTTB_POINTS:
+        return np.arange(n, dtype=np.int64)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    previous = 0
+    for bucket in range(n_out - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        if bucket == n_out - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_stop = edges[bucket + 2]
+            next_x = x[stop:next_stop].mean()
+            next_y = y[stop:next_stop].mean()
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:stop] - y[previous])
+            - (x[previous] - x[start:stop]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        selected[bucket + 1] = previous
+    return selected
+
+
+def min_max(y: npt.NDArray[np.float64], n_out: int) -> npt.NDArray[np.int64]:
+    """Min/max envelope downsampling.
+
+    Splits the series into `n_out // 2` buckets and keeps the minimum and maximum of
+    each bucket, so that no outlier disappears from the plot.
+
+    Args:
+        y: Values to downsample.
+        n_out: Maximum number of points to keep.
+
+    Returns:
+        Sorted unique indices of the selected points.
+    """
+    n = len(y)
+    if n_out >= n:
+        return np.arange(n, dtype=np.int64)
+
+    edges = np.linspace(0, n, max(n_out // 2, 1) + 1).astype(np.int64)
+    selected = [
+        index
+        for start, stop in itertools.pairwise(edges)
+        if stop > start
+        for index in (
+            start + int(np.argmin(y[start:stop])),
+            start + int(np.argmax(y[start:stop])),
+        )
+    ]
+    return np.unique(np.asarray(selected, dtype=np.int64))
+
+
+def decimate(
+    x: npt.NDArray[np.float64],
+    y: npt.NDArray[np.float64],
+    n_out: int,
+    method: DecimationMethod = "lttb",
+) -> npt.NDArray[np.int64]:
+    """Return the indices of at most `n_out` points representing `(x, y)`."""
+    if method == "lttb":
+        return lttb(x, y, n_out)
+    if method == "minmax":
+        return min_max(y, n_out)
+    raise ValueError(f"Unknown decimation method {method!r}")
@@ -6,14 +6,47 @@ from typing import Any
 import pydase
 from pydase.utils.serialization.types import SerializedObject
 
+from icon.server.data_access.repositories.experiment_data_cache import (
+    experiment_data_cache,
+)
 from icon.server.utils.scannable_device_parameters import (
     emit_scannable_device_params_change,
 )
-from icon.server.web_server.socketio_emit_queue import emit_queue
+from icon.server.web_server.sio_setup import (
+    BINARY_EXPERIMENT_DATA_ROOM,
+    AsyncServer,
+    get_binary_experiment_data_sids,
+)
+from icon.server.web_server.socketio_emit_queue import EmitEvent, emit_queue
 
 logger = logging.getLogger(__name__)
 
 
+async def emit(sio: AsyncServer, emit_event: EmitEvent) -> None:
+    """Emit an event, sending `binary_data` to clients that opted into it."""
+    if "binary_data" not in emit_event:
+        await sio.emit(
+            event=emit_event["event"],
+            data=emit_event.get("data", None),
+            room=emit_event.get("room", None),
+        )
+        return
+
+    binary_sids = get_binary_experiment_data_sids(sio)
+    if binary_sids:
+        await sio.emit(
+            event=emit_event["event"],
+            data=emit_event["binary_data"],
+            room=BINARY_EXPERIMENT_DATA_ROOM,
+        )
+    await sio.emit(
+        event=emit_event["event"],
+        data=emit_event.get("data", None),
+        room=emit_event.get("room", None),
+        skip_sid=binary_sids or None,
+    )
+
+
 class IconServer(pydase.Server):
     async def post_startup(self) -> None:
         sio = self._web_server._sio
@@ -24,11 +57,8 @@ class IconServer(pydase.Server):
                     emit_event = await asyncio.to_thread(emit_queue.get, timeout=1.0)
                 except queue.Empty:
                     continue
-                await sio.emit(
-                    event=emit_event["event"],
-                    data=emit_event.get("data", None),
-                    room=emit_event.get("room", None),
-                )
+                experiment_data_cache.apply_event(emit_event)
+                await emit(sio, emit_event)
 
         asyncio.create_task(emit_worker())
 
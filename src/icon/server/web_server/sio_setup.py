@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any
 
@@ -7,8 +8,16 @@ import pydase.data_service.state_manager
 import pydase.server.web_server.sio_setup
 import socketio  # type: ignore
 
+from icon.serialization.typed_array import encode_arrays
+from icon.server.data_access.repositories.experiment_data_repository import (
+    ExperimentDataRepository,
+)
+
 logger = logging.getLogger(__name__)
 
+BINARY_EXPERIMENT_DATA_ROOM = "binary_experiment_data"
+"""Room of clients receiving experiment data events with binary array attachments."""
+
 pydase_setup_sio_events = pydase.server.web_server.sio_setup.setup_sio_events
 
 
@@ -56,6 +65,50 @@ def setup_sio_events(
             sio.controlling_sid = None
             await sio.emit("control_state", {"controlling_sid": None})
 
+    setup_binary_experiment_data_events(sio)
+
+
+def setup_binary_experiment_data_events(sio: AsyncServer) -> None:
+    """Register the events of the opt-in binary experiment data transport."""
+
+    @sio.event
+    async def enable_binary_experiment_data(sid: str) -> None:
+        """Receive `experiment_{job_id}` events with binary array attachments."""
+        await sio.enter_room(sid, BINARY_EXPERIMENT_DATA_ROOM)
+
+    @sio.event
+    async def disable_binary_experiment_data(sid: str) -> None:
+        await sio.leave_room(sid, BINARY_EXPERIMENT_DATA_ROOM)
+
+    @sio.event
+    async def get_experiment_data_columns(
+        sid: str,  # noqa: ARG001
+        data: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """Return columnar experiment data with arrays as binary attachments.
+
+        Binary counterpart of
+        `ExperimentDataController.get_experiment_data_columns_by_job_id`, whose
+        results have to go through the JSON-only `IconSerializer`.
+        """
+        result = await asyncio.to_thread(
+            ExperimentDataRepository.get_experiment_data_columns_by_job_id,
+            job_id=data["job_id"],
+            max_transfer_bytes=data.get("max_transfer_bytes", 50_000_000),
+        )
+        return encode_arrays(result, binary=True)
+
+
+def get_binary_experiment_data_sids(sio: AsyncServer) -> list[str]:
+    """Return the SIDs of clients that enabled binary experiment data."""
+    try:
+        return [
+            sid
+            for sid, _ in sio.manager.get_participants("/", BINARY_EXPERIMENT_DATA_ROOM)
+        ]
+    except KeyError:
+        return []
+
 
 def log_id(headers: Any, sid: str) -> str:
     client_id_header = headers.get("HTTP_X_CLIENT_ID", None)
@@ -8,6 +8,9 @@ class EmitEvent(TypedDict):
     event: str
     data: Any
     room: NotRequired[str]
+    binary_data: NotRequired[Any]
+    """Variant of `data` with arrays encoded as binary attachments, sent instead of
+    `data` to clients in the binary experiment data room."""
 
 
 emit_queue: multiprocessing.Queue[EmitEvent] = multiprocessing.Queue()
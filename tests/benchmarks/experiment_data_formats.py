@@ -0,0 +1,119 @@
+"""Compare the dict and columnar experiment data response formats.
+
+Writes a synthetic job file and measures, for both formats, the server CPU time and
+peak Python memory needed to load the data and serialise it for pydase, as well as
+the size of the resulting JSON payload.
+
+Usage::
+
+    uv run python -m tests.benchmarks.experiment_data_formats --points 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import h5py  # type: ignore
+import numpy as np
+
+from icon.serialization import dump
+from icon.serialization.typed_array import encode_arrays
+from icon.server.data_access.repositories.experiment_data_repository import (
+    _empty_experiment_data,
+    _read_data_point_columns,
+    _read_data_points,
+    h5_open,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def write_synthetic_job(
+    path: Path,
+    *,
+    points: int,
+    result_channels: int = 4,
+    shot_channels: int = 2,
+    shots: int = 50,
+) -> None:
+    """Write an ICON-compatible job file with random data."""
+    rng = np.random.default_rng(0)
+    with h5py.File(path, "w", libver="latest") as h5file:
+        h5file.attrs["number_of_data_points"] = points
+        h5file.attrs["number_of_shots"] = shots
+
+        scan_parameters = np.empty(
+            (points, 1), dtype=[("timestamp", "S26"), ("x", np.float64)]
+        )
+        scan_parameters["timestamp"] = b"2025-01-01T00:00:00.000000"
+        scan_parameters["x"] = np.linspace(0, 1, points)[:, None]
+        h5file.create_dataset("scan_parameters", data=scan_parameters, chunks=True)
+
+        results = np.empty(
+            points, dtype=[(f"ch{i}", np.float64) for i in range(result_channels)]
+        )
+        for name in results.dtype.names or ():
+            results[name] = rng.random(points)
+        h5file.create_dataset("result_channels", data=results, chunks=True)
+
+        shot_group = h5file.create_group("shot_channels")
+        for i in range(shot_channels):
+            shot_group.create_dataset(
+                f"shots{i}",
+                data=rng.poisson(3, (points, shots)).astype(np.float64),
+                chunks=True,
+            )
+        h5file.create_group("vector_channels")
+
+
+def _measure(label: str, load: Callable[[], Any]) -> None:
+    tracemalloc.start()
+    cpu_start = time.process_time()
+    payload = json.dumps(dump(load()))
+    cpu = time.process_time() - cpu_start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(  # noqa: T201
+        f"{label:>9}: cpu {cpu:7.2f} s | peak memory {peak / 1e6:8.1f} MB | "
+        f"payload {len(payload) / 1e6:8.1f} MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--points", type=int, default=20_000)
+    parser.add_argument("--shots", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "job.h5"
+        write_synthetic_job(path, points=args.points, shots=args.shots)
+
+        def load_dicts() -> dict[str, Any]:
+            data = _empty_experiment_data()
+            with h5_open(path, "r") as h5file:
+                _read_data_points(h5file, data, start_index=0, stop_index=args.points)
+            return asdict(data)
+
+        def load_columns() -> dict[str, Any]:
+            with h5_open(path, "r") as h5file:
+                data = _read_data_point_columns(
+                    h5file, start_index=0, stop_index=args.points
+                )
+            return encode_arrays(data)
+
+        print(f"{args.points} data points, {args.shots} shots")  # noqa: T201
+        _measure("dict", load_dicts)
+        _measure("columnar", load_columns)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from icon.serialization.typed_array import (
+    decode_array,
+    decode_arrays,
+    encode_array,
+    encode_arrays,
+    is_encoded_array,
+)
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(5, dtype=np.float64),
+        np.arange(6, dtype=">i4").reshape(2, 3),
+        np.array([b"2025-01-01T00:00:00.000000"], dtype="S26"),
+        np.empty((0, 3), dtype=np.int32),
+    ],
+)
+def test_encode_array_roundtrip(array: np.ndarray) -> None:
+    encoded = encode_array(array)
+
+    assert is_encoded_array(encoded)
+    assert not encoded["dtype"].startswith(">")
+    assert encoded["shape"] == list(array.shape)
+    np.testing.assert_array_equal(decode_array(encoded), array)
+
+
+def test_encode_arrays_binary_roundtrip() -> None:
+    data = {
+        "index": 3,
+        "shot_channels": {"shots": np.array([1, 2, 3])},
+        "vector_channels": {"vec": np.array([0.5, 1.5])},
+    }
+
+    encoded = encode_arrays(data, binary=True)
+
+    assert encoded["index"] == 3  # noqa: PLR2004
+    assert isinstance(encoded["shot_channels"]["shots"]["data"], bytes)
+    decoded = decode_arrays(encoded)
+    np.testing.assert_array_equal(decoded["shot_channels"]["shots"], [1, 2, 3])
+    np.testing.assert_array_equal(decoded["vector_channels"]["vec"], [0.5, 1.5])
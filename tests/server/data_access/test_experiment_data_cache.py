@@ -0,0 +1,133 @@
+import queue
+from dataclasses import asdict
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import icon.server.data_access.repositories.experiment_data_cache as cache_module
+import icon.server.data_access.repositories.experiment_data_repository as repository
+from icon.config.latest import DataConfiguration, ExperimentDataCacheConfig
+from icon.server.data_access.repositories.experiment_data_cache import (
+    ExperimentDataCache,
+)
+from icon.server.data_access.repositories.experiment_data_repository import (
+    ExperimentDataPoint,
+    ExperimentDataRepository,
+    h5_open,
+)
+from icon.server.fitting.fit_runner import FitResult
+from icon.server.web_server.socketio_emit_queue import EmitEvent
+
+JOB_ID = 1
+
+
+@pytest.fixture
+def events(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> queue.Queue[EmitEvent]:
+    """Set up an empty job file and return the queue receiving the emitted events."""
+    config = SimpleNamespace(
+        data=DataConfiguration(
+            results_dir=str(tmp_path),
+            experiment_data_cache=ExperimentDataCacheConfig(max_jobs=1),
+        )
+    )
+    for module in (repository, cache_module):
+        monkeypatch.setattr(module, "get_config", lambda: config)
+    monkeypatch.setattr(
+        repository, "get_filename_by_job_id", lambda job_id: f"job_{job_id}.h5"
+    )
+    emitted: queue.Queue[EmitEvent] = queue.Queue()
+    monkeypatch.setattr(repository, "emit_queue", emitted)
+
+    for job_id in (1, 2):
+        with h5_open(tmp_path / f"job_{job_id}.h5", "a") as h5file:
+            h5file.attrs["number_of_data_points"] = 0
+            h5file.attrs["number_of_shots"] = 2
+    return emitted
+
+
+def _write_points(job_id: int, indices: range) -> None:
+    for index in indices:
+        ExperimentDataRepository.write_experiment_data_by_job_id(
+            job_id=job_id,
+            data_point=ExperimentDataPoint(
+                index=index,
+                scan_params={"x": float(index)},
+                result_channels={"ch": 10.0 * index},
+                shot_channels={"shots": [index, index + 1]},
+                vector_channels={"vec": [float(index)] * 3},
+                timestamp=f"2025-01-01T00:00:{index:09.6f}",
+                sequence_json="seq A" if index < 4 else "seq B",  # noqa: PLR2004
+            ),
+        )
+
+
+def _apply_events(cache: ExperimentDataCache, events: queue.Queue[EmitEvent]) -> None:
+    while not events.empty():
+        cache.apply_event(events.get())
+
+
+def test_running_job_is_updated_from_events(events: queue.Queue[EmitEvent]) -> None:
+    cache = ExperimentDataCache()
+    _write_points(JOB_ID, range(3))
+    _apply_events(cache, events)
+
+    cache.get_experiment_data_by_job_id(job_id=JOB_ID)
+
+    _write_points(JOB_ID, range(3, 6))
+    ExperimentDataRepository.write_parameter_update_by_job_id(
+        job_id=JOB_ID, timestamp="2025-01-01T00:00:04.500000", parameter_values={"a": 1}
+    )
+    fit_result = FitResult(
+        result_channel="ch",
+        func_type="linear",
+        x_range=None,
+        init={},
+        result={"amplitude": 1.0},
+        goodness={},
+        success=True,
+        message="",
+    )
+    repository.write_fit_result_by_job_id(job_id=JOB_ID, fit_result=fit_result)
+    events.put({"event": f"experiment_fit_{JOB_ID}", "data": asdict(fit_result)})
+    _apply_events(cache, events)
+
+    cached = cache.get_experiment_data_by_job_id(job_id=JOB_ID)
+    stored = ExperimentDataRepository.get_experiment_data_by_job_id(job_id=JOB_ID)
+    assert asdict(cached) == asdict(stored)
+    assert cached.total_data_points == 6  # noqa: PLR2004
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["jobs"]) == (1, 1, 1)
+    assert stats["hit_ratio"] == 0.5  # noqa: PLR2004
+
+
+def test_max_transfer_bytes(events: queue.Queue[EmitEvent]) -> None:  # noqa: ARG001
+    cache = ExperimentDataCache()
+    _write_points(JOB_ID, range(10))
+    full = cache.get_experiment_data_by_job_id(job_id=JOB_ID)
+    truncated = cache.get_experiment_data_by_job_id(
+        job_id=JOB_ID, max_transfer_bytes=500
+    )
+
+    assert len(full.result_channels["ch"]) == 10  # noqa: PLR2004
+    assert 0 < len(truncated.result_channels["ch"]) < 10  # noqa: PLR2004
+    assert max(truncated.result_channels["ch"]) == 9  # noqa: PLR2004
+    assert truncated.total_data_points == 10  # noqa: PLR2004
+
+
+def test_metadata_event_and_eviction_drop_jobs(
+    events: queue.Queue[EmitEvent],  # noqa: ARG001
+) -> None:
+    cache = ExperimentDataCache()
+    _write_points(1, range(2))
+    _write_points(2, range(2))
+
+    cache.get_experiment_data_by_job_id(job_id=1)
+    cache.get_experiment_data_by_job_id(job_id=2)
+    assert cache.get_stats()["evictions"] == 1
+    assert cache.get_stats()["jobs"] == 1
+
+    cache.apply_event({"event": "experiment_2_metadata", "data": {}})
+    stats = cache.get_stats()
+    assert (stats["jobs"], stats["bytes"]) == (0, 0)
@@ -0,0 +1,408 @@
+import multiprocessing
+from collections import OrderedDict
+from pathlib import Path
+from types import SimpleNamespace
+
+import h5py  # type: ignore
+import numpy as np
+import pytest
+
+import icon.server.data_access.repositories.experiment_data_repository as repository
+from icon.config.latest import DataConfiguration
+from icon.server.data_access.repositories.experiment_data_repository import (
+    SHOT_CHANNEL_DTYPES_ATTR,
+    ExperimentDataPoint,
+    ExperimentDataRepository,
+    get_result_channels_dataset,
+    h5_open,
+    read_shot_dataset,
+    write_results_to_dataset,
+    write_shot_channels_to_datasets,
+)
+from icon.server.fitting.fit_runner import FitResult
+
+NUMBER_OF_POINTS = 200
+NUMBER_OF_READERS = 4
+
+
+def _write_points(path: Path) -> None:
+    for index in range(NUMBER_OF_POINTS):
+        with h5_open(path, "a") as h5file:
+            write_results_to_dataset(
+                h5file=h5file,
+                data_point_index=index,
+                result_channels={"a": float(index), "b": -float(index)},
+                number_of_data_points=int(h5file.attrs["number_of_data_points"]),
+            )
+            h5file.attrs["number_of_data_points"] = index + 1
+
+
+def _read_points(path: Path, results: multiprocessing.Queue) -> None:  # type: ignore[type-arg]
+    reads = 0
+    try:
+        while True:
+            with h5_open(path, "r") as h5file:
+                total = int(h5file.attrs["number_of_data_points"])
+                rows = h5file["result_channels"][:total]
+            np.testing.assert_array_equal(rows["a"], np.arange(total))
+            np.testing.assert_array_equal(rows["b"], -np.arange(total))
+            reads += 1
+            if total == NUMBER_OF_POINTS:
+                break
+    except Exception as e:
+        results.put(repr(e))
+        return
+    results.put(reads)
+
+
+def _read_number_of_points(path: Path, results: multiprocessing.Queue) -> None:  # type: ignore[type-arg]
+    with h5_open(path, "r") as h5file:
+        results.put(int(h5file.attrs["number_of_data_points"]))
+
+
+def test_reader_attaches_while_writer_holds_file(tmp_path: Path) -> None:
+    path = tmp_path / "job.h5"
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+
+    with h5_open(path, "a") as h5file:
+        h5file.attrs["number_of_data_points"] = 3
+        h5file.flush()
+        reader = ctx.Process(target=_read_number_of_points, args=(path, results))
+        reader.start()
+        reader.join(timeout=30)
+        assert reader.exitcode == 0
+
+    assert results.get(timeout=1) == 3  # noqa: PLR2004
+
+
+def test_swmr_writer_with_concurrent_readers(tmp_path: Path) -> None:
+    path = tmp_path / "job.h5"
+    with h5_open(path, "a") as h5file:
+        h5file.attrs["number_of_data_points"] = 0
+        get_result_channels_dataset(
+            h5file=h5file, result_channels=["a", "b"], number_of_data_points=0
+        )
+
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    readers = [
+        ctx.Process(target=_read_points, args=(path, results))
+        for _ in range(NUMBER_OF_READERS)
+    ]
+    writer = ctx.Process(target=_write_points, args=(path,))
+    for process in (*readers, writer):
+        process.start()
+    writer.join(timeout=60)
+    for reader in readers:
+        reader.join(timeout=60)
+
+    assert writer.exitcode == 0
+    outcomes = [results.get(timeout=1) for _ in readers]
+    assert all(isinstance(reads, int) and reads > 0 for reads in outcomes), outcomes
+
+    with h5py.File(path, "r") as h5file:
+        assert h5file.attrs["number_of_data_points"] == NUMBER_OF_POINTS
+        assert h5file["result_channels"].shape == (NUMBER_OF_POINTS,)
+
+
+JOB_ID = 1
+JOB_POINTS = 5
+
+
+def _timestamp(seconds: float) -> str:
+    return f"2025-01-01T00:00:{seconds:09.6f}"
+
+
+@pytest.fixture
+def job_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Write a small job file through the repository and return its path."""
+    monkeypatch.setattr(repository, "get_filename_by_job_id", lambda _: "job.h5")
+    monkeypatch.setattr(
+        repository,
+        "get_config",
+        lambda: SimpleNamespace(data=DataConfiguration(results_dir=str(tmp_path))),
+    )
+    path = tmp_path / "job.h5"
+    with h5_open(path, "a") as h5file:
+        h5file.attrs["number_of_data_points"] = 0
+        h5file.attrs["number_of_shots"] = 3
+
+    for index in range(JOB_POINTS):
+        ExperimentDataRepository.write_experiment_data_by_job_id(
+            job_id=JOB_ID,
+            data_point=ExperimentDataPoint(
+                index=index,
+                scan_params={"x": float(index)},
+                result_channels={"ch": 10.0 * index},
+                shot_channels={"shots": [index, index + 1, index + 2]},
+                vector_channels={"vec": [float(index)] * 2},
+                timestamp=_timestamp(index),
+                sequence_json="seq A" if index < 3 else "seq B",  # noqa: PLR2004
+            ),
+        )
+    ExperimentDataRepository.write_parameter_update_by_job_id(
+        job_id=JOB_ID, timestamp=_timestamp(1.5), parameter_values={"a": 1.0}
+    )
+    ExperimentDataRepository.write_parameter_update_by_job_id(
+        job_id=JOB_ID,
+        timestamp=_timestamp(3.5),
+        parameter_values={"a": 1.0, "b": "on"},
+    )
+    return path
+
+
+def test_get_experiment_data_since_index(job_file: Path) -> None:  # noqa: ARG001
+    data = ExperimentDataRepository.get_experiment_data_since_index(
+        job_id=JOB_ID, since_index=3
+    )
+
+    assert data.total_data_points == JOB_POINTS
+    assert data.result_channels == {"ch": {3: 30.0, 4: 40.0}}
+    assert data.scan_parameters["x"] == {3: 3.0, 4: 4.0}
+    assert data.shot_channels == {"shots": {3: [3, 4, 5], 4: [4, 5, 6]}}
+    assert data.vector_channels == {"vec": {3: [3.0, 3.0], 4: [4.0, 4.0]}}
+    assert data.json_sequences == [[3, "seq B"]]
+    assert set(data.parameters) == {"b"}
+
+
+def test_get_experiment_data_since_index_with_until_index(job_file: Path) -> None:  # noqa: ARG001
+    data = ExperimentDataRepository.get_experiment_data_since_index(
+        job_id=JOB_ID, since_index=1, until_index=3
+    )
+
+    assert data.result_channels == {"ch": {1: 10.0, 2: 20.0}}
+    assert data.json_sequences == []
+    assert set(data.parameters) == {"a", "b"}
+
+    data = ExperimentDataRepository.get_experiment_data_since_index(
+        job_id=JOB_ID, since_index=JOB_POINTS
+    )
+    assert data.total_data_points == JOB_POINTS
+    assert data.result_channels == {"ch": {}}
+
+
+def test_get_experiment_data_columns_by_job_id(job_file: Path) -> None:  # noqa: ARG001
+    data = ExperimentDataRepository.get_experiment_data_columns_by_job_id(job_id=JOB_ID)
+    dict_data = ExperimentDataRepository.get_experiment_data_by_job_id(job_id=JOB_ID)
+
+    assert data is not None
+    np.testing.assert_array_equal(data.index, np.arange(JOB_POINTS))
+    assert data.timestamps.tolist() == [
+        _timestamp(i).encode() for i in range(JOB_POINTS)
+    ]
+    np.testing.assert_array_equal(data.scan_parameters["x"], np.arange(JOB_POINTS))
+    np.testing.assert_array_equal(
+        data.result_channels["ch"], list(dict_data.result_channels["ch"].values())
+    )
+    assert data.shot_channels["shots"].shape == (JOB_POINTS, 3)
+    assert data.shot_channels["shots"].tolist() == list(
+        dict_data.shot_channels["shots"].values()
+    )
+
+    vectors = data.vector_channels["vec"]
+    np.testing.assert_array_equal(vectors.index, np.arange(JOB_POINTS))
+    np.testing.assert_array_equal(vectors.offsets, np.arange(0, 2 * JOB_POINTS + 1, 2))
+    np.testing.assert_array_equal(
+        vectors.values, np.repeat(np.arange(JOB_POINTS, dtype=np.float64), 2)
+    )
+    assert data.json_sequences == dict_data.json_sequences
+    assert data.total_data_points == JOB_POINTS
+
+
+def test_get_decimated_result_channel(job_file: Path) -> None:  # noqa: ARG001
+    data = ExperimentDataRepository.get_decimated_result_channel(
+        job_id=JOB_ID, result_channel="ch", target_points=3
+    )
+
+    assert data is not None
+    assert data.points_in_range == JOB_POINTS
+    assert len(data.index) == 3  # noqa: PLR2004
+    assert data.index[0] == 0
+    assert data.index[-1] == JOB_POINTS - 1
+    np.testing.assert_array_equal(data.y, 10.0 * data.index)
+
+    zoomed = ExperimentDataRepository.get_decimated_result_channel(
+        job_id=JOB_ID, result_channel="ch", x_parameter="x", x_range=(1.0, 3.0)
+    )
+    assert zoomed is not None
+    np.testing.assert_array_equal(zoomed.index, [1, 2, 3])
+    np.testing.assert_array_equal(zoomed.x, [1.0, 2.0, 3.0])
+
+    assert (
+        ExperimentDataRepository.get_decimated_result_channel(
+            job_id=JOB_ID, result_channel="missing"
+        )
+        is None
+    )
+
+
+def _write_shots(path: Path, shots: list[dict[str, list[int]]]) -> None:
+    with h5_open(path, "a") as h5file:
+        h5file.require_group("shot_channels").attrs[SHOT_CHANNEL_DTYPES_ATTR] = (
+            '{"bits": "bool"}'
+        )
+        for index, shot_channels in enumerate(shots):
+            write_shot_channels_to_datasets(
+                h5file=h5file,
+                data_point_index=index,
+                shot_channels=shot_channels,
+                number_of_data_points=index,
+                number_of_shots=10,
+            )
+
+
+def test_shot_channels_use_compact_dtypes(tmp_path: Path) -> None:
+    path = tmp_path / "job.h5"
+    bits = [[1, 0, 1, 1, 0, 0, 0, 1, 1, 0], [0] * 10]
+    counts = [list(range(10)), list(range(10, 20))]
+    _write_shots(
+        path,
+        [{"bits": b, "counts": c} for b, c in zip(bits, counts, strict=True)],
+    )
+
+    with h5_open(path, "r") as h5file:
+        shot_group = h5file["shot_channels"]
+        assert shot_group["bits"].dtype == np.uint8
+        assert shot_group["bits"].shape == (2, 2)
+        assert shot_group["counts"].dtype == np.uint16
+        np.testing.assert_array_equal(read_shot_dataset(shot_group["bits"]), bits)
+        np.testing.assert_array_equal(read_shot_dataset(shot_group["counts"]), counts)
+
+
+def test_shot_channels_are_widened_when_values_do_not_fit(job_file: Path) -> None:
+    for index, shots in ((JOB_POINTS, [70_000] * 3), (JOB_POINTS + 1, [0.5] * 3)):
+        ExperimentDataRepository.write_experiment_data_by_job_id(
+            job_id=JOB_ID,
+            data_point=ExperimentDataPoint(
+                index=index,
+                scan_params={"x": float(index)},
+                result_channels={"ch": 10.0 * index},
+                shot_channels={"shots": shots},
+                vector_channels={},
+                timestamp=_timestamp(index),
+                sequence_json="seq B",
+            ),
+        )
+
+    with h5_open(job_file, "r") as h5file:
+        assert h5file["shot_channels"]["shots"].dtype == np.float64
+
+    data = ExperimentDataRepository.get_experiment_data_by_job_id(job_id=JOB_ID)
+    assert data.shot_channels["shots"][0] == [0.0, 1.0, 2.0]
+    assert data.shot_channels["shots"][JOB_POINTS] == [70_000.0] * 3
+    assert data.shot_channels["shots"][JOB_POINTS + 1] == [0.5] * 3
+
+
+def test_get_shot_statistics_by_job_id(job_file: Path) -> None:
+    statistics = ExperimentDataRepository.get_shot_statistics_by_job_id(
+        job_id=JOB_ID, start_index=1, stop_index=3
+    )
+
+    assert statistics is not None
+    shots = statistics["shots"]
+    np.testing.assert_array_equal(shots.mean, [2.0, 3.0])
+    np.testing.assert_allclose(shots.variance, [2 / 3, 2 / 3])
+    np.testing.assert_array_equal(shots.histogram[0, :4], [0, 1, 1, 1])
+    np.testing.assert_array_equal(shots.thresholds, [0.5])
+    np.testing.assert_array_equal(shots.populations, [[1.0], [1.0]])
+
+    with h5_open(job_file, "a", swmr_write=False) as h5file:
+        del h5file["shot_statistics"]
+    computed = ExperimentDataRepository.get_shot_statistics_by_job_id(
+        job_id=JOB_ID, start_index=1, stop_index=3
+    )
+    assert computed is not None
+    np.testing.assert_array_equal(computed["shots"].histogram, shots.histogram)
+    np.testing.assert_array_equal(computed["shots"].mean, shots.mean)
+
+
+def test_replace_and_delete_fit_result(job_file: Path) -> None:  # noqa: ARG001
+    for amplitude in (1.0, 2.0):
+        repository.write_fit_result_by_job_id(
+            job_id=JOB_ID,
+            fit_result=FitResult(
+                result_channel="ch",
+                func_type="linear",
+                x_range=None,
+                init={},
+                result={"amplitude": amplitude},
+                goodness={},
+                success=True,
+                message="",
+            ),
+        )
+    fits = repository.get_fit_results_by_job_id(job_id=JOB_ID)
+    assert fits["ch"]["result"] == {"amplitude": 2.0}
+
+    repository.delete_fit_result_by_job_id(job_id=JOB_ID, result_channel="ch")
+    assert repository.get_fit_results_by_job_id(job_id=JOB_ID) == {}
+
+
+def test_parameter_history(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(repository, "_parameter_history_states", OrderedDict())
+    path = tmp_path / "parameters.h5"
+    updates = [
+        ("2025-01-01T00:00:01.000000", {"f": 1.5, "i": 2, "b": True, "s": "on"}),
+        ("2025-01-01T00:00:02.000000", {"f": 1.5, "i": 3, "b": True, "s": "on"}),
+        ("2025-01-01T00:00:03.000000", {"f": 1.5, "i": 3, "b": False, "s": "off"}),
+    ]
+    written = []
+    for timestamp, values in updates:
+        with h5_open(path, "a") as h5file:
+            written.append(
+                repository.write_parameter_values_to_history(
+                    h5file, timestamp=timestamp, parameter_values=values
+                )
+            )
+    assert [set(update) for update in written] == [
+        {"f", "i", "b", "s"},
+        {"i"},
+        {"b", "s"},
+    ]
+
+    # a new writer process starts without in-memory state
+    repository._parameter_history_states.clear()
+    with h5_open(path, "a") as h5file:
+        assert not repository.write_parameter_values_to_history(
+            h5file,
+            timestamp="2025-01-01T00:00:04.000000",
+            parameter_values={"f": 1.5, "i": 3, "b": False, "s": "off"},
+        )
+
+    with h5_open(path, "r") as h5file:
+        assert h5file[repository.PARAMETER_HISTORY_DATASET].shape == (7,)
+        parameters = repository.extract_parameter_values(h5file)
+        recent = repository.extract_parameter_values(
+            h5file, since="2025-01-01T00:00:02.000000"
+        )
+
+    assert {name: value.value for name, value in parameters.items()} == {
+        "f": 1.5,
+        "i": 3,
+        "b": False,
+        "s": "off",
+    }
+    assert type(parameters["i"].value) is int
+    assert parameters["i"].timestamp == "2025-01-01T00:00:02.000000"
+    assert set(recent) == {"b", "s"}
+
+
+def test_extract_legacy_parameter_values(tmp_path: Path) -> None:
+    path = tmp_path / "legacy.h5"
+    with h5py.File(path, "w") as h5file:
+        dataset = h5file.create_dataset(
+            "parameters/namespace/a",
+            shape=(2,),
+            dtype=[("timestamp", "S26"), ("value", np.float64)],
+        )
+        dataset[:] = [
+            (b"2025-01-01T00:00:01.000000", 1.0),
+            (b"2025-01-01T00:00:02.000000", 2.0),
+        ]
+
+    with h5_open(path, "r") as h5file:
+        parameters = repository.extract_parameter_values(h5file)
+    assert parameters == {
+        "namespace/a": repository.ParameterValue("2025-01-01T00:00:02.000000", 2.0)
+    }
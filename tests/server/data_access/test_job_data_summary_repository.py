@@ -0,0 +1,180 @@
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import sqlalchemy
+import sqlalchemy.orm
+
+import icon.server.data_access.repositories.experiment_data_repository as data_repository
+import icon.server.data_access.repositories.job_data_summary_repository as repository
+from icon.config.latest import DataConfiguration
+from icon.server.data_access.models.enums import JobStatus
+from icon.server.data_access.models.sqlite import ExperimentSource, Job
+from icon.server.data_access.models.sqlite.base import Base
+from icon.server.data_access.repositories.experiment_data_repository import (
+    ExperimentDataPoint,
+    ExperimentDataRepository,
+    h5_open,
+)
+from icon.server.data_access.repositories.job_data_summary_repository import (
+    JobDataSummaryRepository,
+)
+
+
+@pytest.fixture
+def engine(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> sqlalchemy.Engine:
+    """Point the repositories at a fresh SQLite database and results directory."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'icon.db'}")
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(repository, "engine", engine)
+
+    def config() -> SimpleNamespace:
+        return SimpleNamespace(data=DataConfiguration(results_dir=str(tmp_path)))
+
+    for module in (repository, data_repository):
+        monkeypatch.setattr(module, "get_config", config)
+        monkeypatch.setattr(
+            module, "get_filename_by_job_id", lambda job_id: f"job_{job_id}.h5"
+        )
+
+    with sqlalchemy.orm.Session(engine) as session:
+        session.add(ExperimentSource(id=1, experiment_id="exp"))
+        session.add_all(
+            Job(id=job_id, experiment_source_id=1, status=JobStatus.PROCESSED)
+            for job_id in (1, 2, 3)
+        )
+        session.commit()
+    return engine
+
+
+def _data_point(index: int) -> ExperimentDataPoint:
+    return ExperimentDataPoint(
+        index=index,
+        scan_params={"x": float(index)},
+        result_channels={"ch": float(index)},
+        shot_channels={"shots": [0, 1]},
+        vector_channels={},
+        timestamp=f"2025-01-01T00:00:{index:09.6f}",
+        sequence_json="seq",
+    )
+
+
+def _write_job_file(tmp_path: Path, job_id: int, number_of_points: int) -> Path:
+    path = tmp_path / f"job_{job_id}.h5"
+    with h5_open(path, "a") as h5file:
+        h5file.attrs["number_of_data_points"] = 0
+        h5file.attrs["number_of_shots"] = 2
+        h5file.attrs["job_id"] = job_id
+        h5file.attrs["realtime_scan"] = False
+    for index in range(number_of_points):
+        ExperimentDataRepository.write_experiment_data_by_job_id(
+            job_id=job_id, data_point=_data_point(index)
+        )
+    return path
+
+
+def test_update_data_point(engine: sqlalchemy.Engine) -> None:  # noqa: ARG001
+    for index in (0, 2, 1):
+        JobDataSummaryRepository.update_data_point(
+            job_id=1,
+            experiment_source_id=1,
+            data_point=_data_point(index),
+            realtime_scan=False,
+        )
+
+    summary = JobDataSummaryRepository.get_summary_by_job_id(job_id=1)
+    assert summary is not None
+    assert summary.number_of_data_points == 3  # noqa: PLR2004
+    assert summary.last_timestamp == _data_point(2).timestamp
+    assert summary.result_channels == ["ch"]
+    assert summary.shot_channels == ["shots"]
+    assert not summary.has_fit
+
+
+def test_update_fitted_channel(engine: sqlalchemy.Engine) -> None:  # noqa: ARG001
+    JobDataSummaryRepository.update_data_point(
+        job_id=1, experiment_source_id=1, data_point=_data_point(0), realtime_scan=False
+    )
+    JobDataSummaryRepository.update_fitted_channel(
+        job_id=1, result_channel="ch", has_fit=True
+    )
+    summary = JobDataSummaryRepository.get_summary_by_job_id(job_id=1)
+    assert summary is not None
+    assert summary.fitted_channels == ["ch"]
+    assert summary.has_fit
+
+    JobDataSummaryRepository.update_fitted_channel(
+        job_id=1, result_channel="ch", has_fit=False
+    )
+    summary = JobDataSummaryRepository.get_summary_by_job_id(job_id=1)
+    assert summary is not None
+    assert summary.fitted_channels == []
+    assert not summary.has_fit
+
+
+def test_backfill(engine: sqlalchemy.Engine, tmp_path: Path) -> None:  # noqa: ARG001
+    _write_job_file(tmp_path, job_id=1, number_of_points=4)
+    _write_job_file(tmp_path, job_id=2, number_of_points=2)
+    _write_job_file(tmp_path, job_id=99, number_of_points=1)  # unknown job
+
+    assert JobDataSummaryRepository.backfill() == 2  # noqa: PLR2004
+
+    summaries = JobDataSummaryRepository.get_summaries(experiment_source_id=1)
+    assert [summary.job_id for summary in summaries] == [1, 2]
+    assert summaries[0].number_of_data_points == 4  # noqa: PLR2004
+    assert summaries[0].last_timestamp == _data_point(3).timestamp
+    assert summaries[0].result_channels == ["ch"]
+    assert summaries[0].file_size == (tmp_path / "job_1.h5").stat().st_size
+
+
+def test_get_latest_job_id_with_fit(engine: sqlalchemy.Engine) -> None:  # noqa: ARG001
+    for job_id in (1, 2, 3):
+        JobDataSummaryRepository.update_data_point(
+            job_id=job_id,
+            experiment_source_id=1,
+            data_point=_data_point(0),
+            realtime_scan=False,
+        )
+    assert (
+        JobDataSummaryRepository.get_latest_job_id_with_fit(experiment_source_id=1)
+        is None
+    )
+
+    for job_id in (1, 2):
+        JobDataSummaryRepository.update_fitted_channel(
+            job_id=job_id, result_channel="ch", has_fit=True
+        )
+    latest = JobDataSummaryRepository.get_latest_job_id_with_fit(experiment_source_id=1)
+    assert latest == 2  # noqa: PLR2004
+    assert (
+        JobDataSummaryRepository.get_latest_job_id_with_fit(
+            experiment_source_id=1, exclude_job_id=2
+        )
+        == 1
+    )
+
+
+def test_get_job_ids_to_compact(engine: sqlalchemy.Engine) -> None:  # noqa: ARG001
+    for job_id in (1, 2):
+        JobDataSummaryRepository.update_data_point(
+            job_id=job_id,
+            experiment_source_id=1,
+            data_point=_data_point(0),
+            realtime_scan=False,
+        )
+    now = datetime.now(UTC)
+
+    assert JobDataSummaryRepository.get_job_ids_to_compact(updated_before=now) == [1, 2]
+    assert (
+        JobDataSummaryRepository.get_job_ids_to_compact(
+            updated_before=now - timedelta(minutes=5)
+        )
+        == []
+    )
+
+    JobDataSummaryRepository.mark_compacted(job_id=1, file_size=123)
+    assert JobDataSummaryRepository.get_job_ids_to_compact(updated_before=now) == [2]
+    summary = JobDataSummaryRepository.get_summary_by_job_id(job_id=1)
+    assert summary is not None
+    assert (summary.compacted, summary.file_size) == (True, 123)
@@ -0,0 +1,139 @@
+import queue
+import time
+from dataclasses import asdict
+from pathlib import Path
+from types import SimpleNamespace
+
+import h5py  # type: ignore
+import numpy as np
+import pytest
+
+import icon.server.data_access.repositories.experiment_data_repository as repository
+from icon.config.latest import DataConfiguration
+from icon.server.data_access.repositories.experiment_data_repository import (
+    ExperimentDataPoint,
+    ExperimentDataRepository,
+    h5_open,
+)
+from icon.server.post_processing.compaction import (
+    CompactionAbortedError,
+    IOBudget,
+    compact_job_file,
+)
+
+JOB_ID = 1
+JOB_POINTS = 300
+
+
+@pytest.fixture
+def job_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Write a job file point by point through the repository."""
+    monkeypatch.setattr(repository, "get_filename_by_job_id", lambda _: "job.h5")
+    monkeypatch.setattr(
+        repository,
+        "get_config",
+        lambda: SimpleNamespace(data=DataConfiguration(results_dir=str(tmp_path))),
+    )
+    monkeypatch.setattr(repository, "emit_queue", queue.Queue())
+    path = tmp_path / "job.h5"
+    with h5_open(path, "a") as h5file:
+        h5file.attrs["number_of_data_points"] = 0
+        h5file.attrs["number_of_shots"] = 50
+        h5file.attrs["job_id"] = JOB_ID
+
+    for index in range(JOB_POINTS):
+        ExperimentDataRepository.write_experiment_data_by_job_id(
+            job_id=JOB_ID,
+            data_point=ExperimentDataPoint(
+                index=index,
+                scan_params={"x": float(index)},
+                result_channels={"ch": 10.0 * index},
+                shot_channels={"shots": [index % 7] * 50},
+                vector_channels={"vec": [float(index)] * 4},
+                timestamp=f"2025-01-01T00:{index // 60:02d}:{index % 60:09.6f}",
+                sequence_json="seq A" if index < 100 else "seq B",  # noqa: PLR2004
+            ),
+        )
+        if index % 50 == 0:
+            ExperimentDataRepository.write_parameter_update_by_job_id(
+                job_id=JOB_ID,
+                timestamp=f"2025-01-01T00:{index // 60:02d}:{index % 60:09.6f}",
+                parameter_values={"a": float(index), "b": "on"},
+            )
+    return path
+
+
+def _collect(h5file: h5py.File) -> dict[str, object]:
+    items: dict[str, object] = {"/": dict(h5file.attrs)}
+
+    def visitor(name: str, obj: h5py.HLObject) -> None:
+        items[name] = (
+            dict(obj.attrs),
+            obj[()].tolist() if isinstance(obj, h5py.Dataset) else None,
+        )
+
+    h5file.visititems(visitor)
+    return items
+
+
+def test_compact_job_file(job_file: Path) -> None:
+    data_before = ExperimentDataRepository.get_experiment_data_by_job_id(job_id=JOB_ID)
+    with h5_open(job_file, "r") as h5file:
+        contents_before = _collect(h5file)
+    size_before = job_file.stat().st_size
+
+    size = compact_job_file(job_file)
+
+    assert size == job_file.stat().st_size
+    assert size < size_before
+    assert not job_file.with_name("job.h5.compacting").exists()
+    with h5_open(job_file, "r") as h5file:
+        np.testing.assert_equal(_collect(h5file), contents_before)
+        assert h5file["shot_channels/shots"].chunks[0] == JOB_POINTS
+    data_after = ExperimentDataRepository.get_experiment_data_by_job_id(job_id=JOB_ID)
+    assert asdict(data_after) == asdict(data_before)
+
+    # the compacted file can still be written to, e.g. by fits
+    repository.write_fit_result_by_job_id(
+        job_id=JOB_ID,
+        fit_result=repository.FitResult(
+            result_channel="ch",
+            func_type="linear",
+            x_range=None,
+            init={},
+            result={},
+            goodness={},
+            success=True,
+            message="",
+        ),
+    )
+    assert set(repository.get_fit_results_by_job_id(job_id=JOB_ID)) == {"ch"}
+
+
+def test_aborted_compaction_keeps_file(job_file: Path) -> None:
+    contents_before = job_file.read_bytes()
+
+    with pytest.raises(CompactionAbortedError):
+        compact_job_file(job_file, should_continue=lambda: False)
+
+    assert job_file.read_bytes() == contents_before
+    assert not job_file.with_name("job.h5.compacting").exists()
+
+
+def test_file_modified_during_compaction_is_kept(job_file: Path) -> None:
+    def modify() -> bool:
+        with h5_open(job_file, "a") as h5file:
+            h5file.attrs["modified"] = True
+        return True
+
+    assert compact_job_file(job_file, should_continue=modify) is None
+    with h5_open(job_file, "r") as h5file:
+        assert h5file.attrs["modified"]
+
+
+def test_io_budget() -> None:
+    io_budget = IOBudget(bytes_per_second=1_000_000)
+    start = time.monotonic()
+    for _ in range(4):
+        io_budget.consume(50_000)
+    assert time.monotonic() - start >= 0.15  # noqa: PLR2004
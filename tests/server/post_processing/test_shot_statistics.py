@@ -0,0 +1,14 @@
+import numpy as np
+
+from icon.server.post_processing.shot_statistics import compute_shot_statistics
+
+
+def test_compute_shot_statistics() -> None:
+    shots = np.array([[0, 1, 1, 5], [2, 2, 9, 0]])
+
+    statistics = compute_shot_statistics(shots, histogram_bins=4, thresholds=[0.5, 1.5])
+
+    np.testing.assert_array_equal(statistics.histogram, [[1, 2, 0, 1], [1, 0, 2, 1]])
+    np.testing.assert_array_equal(statistics.mean, [1.75, 3.25])
+    np.testing.assert_array_equal(statistics.variance, shots.var(axis=1))
+    np.testing.assert_array_equal(statistics.populations, [[0.75, 0.25], [0.75, 0.75]])
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from icon.server.utils.decimation import decimate, lttb, min_max
+
+
+def test_lttb_keeps_endpoints_and_peak() -> None:
+    x = np.arange(1000, dtype=np.float64)
+    y = np.sin(x / 50)
+    y[500] = 10.0
+
+    selected = lttb(x, y, 50)
+
+    assert len(selected) == 50  # noqa: PLR2004
+    assert selected[0] == 0
+    assert selected[-1] == len(x) - 1
+    assert np.all(np.diff(selected) > 0)
+    assert 500 in selected  # noqa: PLR2004
+
+
+def test_min_max_keeps_extrema() -> None:
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=10_000)
+
+    selected = min_max(y, 100)
+
+    assert len(selected) <= 100  # noqa: PLR2004
+    assert np.argmin(y) in selected
+    assert np.argmax(y) in selected
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_decimate_returns_all_points_below_target(method: str) -> None:
+    x = np.arange(10, dtype=np.float64)
+
+    np.testing.assert_array_equal(decimate(x, x, 100, method), np.arange(10))  # type: ignore[arg-type]
+
+
+def test_decimate_rejects_unknown_method() -> None:
+    x = np.arange(10, dtype=np.float64)
+
+    with pytest.raises(ValueError, match="Unknown decimation method"):
+        decimate(x, x, 5, "average")  # type: ignore[arg-type]